@@ -0,0 +1,258 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import gc
+import json
+import pathlib
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import mystbin
+from mystbin.utils import msgspec, orjson
+
+from .cases import CHARSETS, FILE_COUNTS, SIZES, collect, names
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .cases import Benchmark
+
+
+class Result(NamedTuple):
+    """The timing and peak allocations of a benchmark, times being seconds per call."""
+
+    name: str
+    time: float
+    stdev: float
+    loops: int
+    peak: int | None
+
+
+def _calibrate(bench: Benchmark, min_time: float, /) -> int:
+    # Double the loop count until a sample takes long enough to time reliably.
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            bench()
+        if time.perf_counter() - start >= min_time or loops >= 1 << 20:
+            return loops
+        loops *= 2
+
+
+def _sample(bench: Benchmark, loops: int, /) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        bench()
+    return (time.perf_counter() - start) / loops
+
+
+def _peak(bench: Benchmark, /) -> int:
+    # Measured in a separate call, as tracing slows allocation-heavy code down considerably.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        bench()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(name: str, bench: Benchmark, /, *, samples: int, min_time: float, memory: bool) -> Result:
+    """Time a benchmark over ``samples`` samples of at least ``min_time`` seconds each.
+
+    Returns
+    -------
+    :class:`Result`
+        The fastest time per call, and the peak traced allocations of a single call if ``memory`` is set.
+        Slower samples are mostly interference from the rest of the machine, so the fastest is the most repeatable.
+    """
+    gc.collect()
+    loops = _calibrate(bench, min_time)
+    timings = [_sample(bench, loops) for _ in range(samples)]
+    return Result(
+        name=name,
+        time=min(timings),
+        stdev=statistics.stdev(timings) if samples > 1 else 0.0,
+        loops=loops,
+        peak=_peak(bench) if memory else None,
+    )
+
+
+def _format_time(seconds: float, /) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def _format_bytes(size: float | None, /) -> str:
+    if size is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _metadata() -> dict[str, Any]:
+    return {
+        "mystbin": mystbin.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "orjson": getattr(orjson, "__version__", None),
+        "msgspec": getattr(msgspec, "__version__", None),
+        "timestamp": time.time(),
+    }
+
+
+def _compare(result: Result, baseline: dict[str, Any], threshold: float, /) -> tuple[str, bool]:
+    previous = baseline.get(result.name)
+    if previous is None:
+        return "new", False
+
+    notes: list[str] = []
+    regressed = False
+    ratio = result.time / previous["time"]
+    notes.append(f"{ratio:.2f}x time")
+    if ratio > 1 + threshold:
+        regressed = True
+
+    if result.peak is not None and previous.get("peak"):
+        memory = result.peak / previous["peak"]
+        notes.append(f"{memory:.2f}x peak")
+        # Small peaks are dominated by interpreter noise, so they need to grow by a few KiB to count.
+        if memory > 1 + threshold and result.peak - previous["peak"] > 4096:
+            regressed = True
+
+    if regressed:
+        notes.append("REGRESSION")
+    return ", ".join(notes), regressed
+
+
+def _csv(value: str, /) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark mystbin.py's serialization, decoding and model construction on synthetic pastes.",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Only run benchmarks whose name matches this glob, e.g. 'decode*/1MB-*'. May be given more than once.",
+    )
+    parser.add_argument("--sizes", type=_csv, default=list(SIZES), help=f"Paste sizes. Default: {','.join(SIZES)}.")
+    parser.add_argument(
+        "--files",
+        type=lambda value: [int(item) for item in _csv(value)],
+        default=list(FILE_COUNTS),
+        help=f"File counts. Default: {','.join(map(str, FILE_COUNTS))}.",
+    )
+    parser.add_argument("--charsets", type=_csv, default=list(CHARSETS), help=f"Default: {','.join(CHARSETS)}.")
+    parser.add_argument("--quick", action="store_true", help="Only pastes up to 1MB with 1 or 10 files.")
+    parser.add_argument("--samples", type=int, default=5, help="Timed samples per benchmark. Default: 5.")
+    parser.add_argument(
+        "--min-time", type=float, default=0.1, help="Minimum duration of a sample, in seconds. Default: 0.1."
+    )
+    parser.add_argument("--no-memory", action="store_true", help="Skip measuring peak allocations.")
+    parser.add_argument("--list", action="store_true", help="List the selected benchmarks without running them.")
+    parser.add_argument("--save", type=pathlib.Path, metavar="PATH", help="Save the results as a baseline.")
+    parser.add_argument("--compare", type=pathlib.Path, metavar="PATH", help="Compare the results to a saved baseline.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="How much slower or larger than the baseline a result may be before it is a regression. Default: 0.1.",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:  # noqa: D103
+    args = _parser().parse_args(argv)
+    if args.quick:
+        args.sizes = [size for size in args.sizes if SIZES[size] <= SIZES["1MB"]]
+        args.files = [count for count in args.files if count <= 10]
+
+    unknown = [size for size in args.sizes if size not in SIZES] + [c for c in args.charsets if c not in CHARSETS]
+    if unknown:
+        sys.stderr.write(f"Unknown sizes or charsets: {', '.join(unknown)}\n")
+        return 2
+
+    patterns: list[str] = args.filter
+
+    def select(name: str) -> bool:
+        return not patterns or any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+    if args.list:
+        sys.stdout.writelines(f"{name}\n" for name in names(args.sizes, args.files, args.charsets) if select(name))
+        return 0
+
+    baseline: dict[str, Any] = {}
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())["results"]
+
+    results: dict[str, dict[str, Any]] = {}
+    regressions = 0
+    sys.stdout.write(f"{'benchmark':<52} {'time':>10} {'+/-':>7} {'peak':>11}  {'vs baseline' if baseline else ''}\n")
+    for name, bench in collect(args.sizes, args.files, args.charsets, select=select):
+        result = run(name, bench, samples=args.samples, min_time=args.min_time, memory=not args.no_memory)
+        results[name] = {"time": result.time, "stdev": result.stdev, "loops": result.loops, "peak": result.peak}
+
+        comparison = ""
+        if baseline:
+            comparison, regressed = _compare(result, baseline, args.threshold)
+            regressions += regressed
+
+        spread = f"{result.stdev / result.time:.1%}" if result.time else "-"
+        sys.stdout.write(
+            f"{name:<52} {_format_time(result.time):>10} {spread:>7} {_format_bytes(result.peak):>11}  {comparison}\n"
+        )
+        sys.stdout.flush()
+
+    if args.save is not None:
+        args.save.write_text(json.dumps({"metadata": _metadata(), "results": results}, indent=2))
+        sys.stdout.write(f"Saved {len(results)} results to {args.save}\n")
+
+    if regressions:
+        sys.stdout.write(f"{regressions} benchmark(s) regressed by more than {args.threshold:.0%}.\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
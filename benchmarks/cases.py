@@ -0,0 +1,307 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Iterator, NamedTuple, TypeVar
+
+from mystbin import File, Paste
+from mystbin.http import (
+    HTTPClient,
+    Route,
+    _encode_paste,  # noqa: PLC2701
+    _json_or_text,  # noqa: PLC2701
+)
+from mystbin.types_.structs import decode_typed
+from mystbin.utils import msgspec, orjson, to_json
+
+if TYPE_CHECKING:
+    from mystbin.types_.responses import FileResponse, GetPasteResponse
+    from mystbin.utils import JSONLoads
+
+    T = TypeVar("T")
+
+__all__ = (
+    "CHARSETS",
+    "FILE_COUNTS",
+    "SIZES",
+    "Benchmark",
+    "Payload",
+    "collect",
+    "names",
+)
+
+SIZES: dict[str, int] = {
+    "1KB": 1 << 10,
+    "64KB": 64 << 10,
+    "1MB": 1 << 20,
+    "10MB": 10 << 20,
+    "50MB": 50 << 20,
+}
+FILE_COUNTS: tuple[int, ...] = (1, 10, 100)
+CHARSETS: dict[str, str] = {
+    # Code with the characters JSON has to escape.
+    "ascii": 'def greet(name):\n\treturn "Hello, " + name + "!\\n"\n',
+    # Two, three and four byte UTF-8 sequences, the latter escaped as surrogate pairs by some encoders.
+    "unicode": "café — naïve ✓ 日本語のテキスト 🐍🚀\n",
+}
+
+Benchmark = Callable[[], Any]
+Factory = Callable[["Payload"], Benchmark]
+
+
+class Payload(NamedTuple):
+    """A synthetic paste, pre-built in every shape the benchmarks need."""
+
+    label: str
+    contents: list[str]
+    files: list[File]
+    response: GetPasteResponse
+    body: bytes
+    http: HTTPClient
+
+    @classmethod
+    def build(cls, size: str, count: int, charset: str, /) -> Payload:
+        """Build a paste of ``size`` (a key of :data:`SIZES`) split across ``count`` files of ``charset`` text.
+
+        Returns
+        -------
+        :class:`Payload`
+        """
+        unit = CHARSETS[charset]
+        # Split ``size`` UTF-8 bytes across the files; the unit is repeated then cut to roughly that many bytes.
+        per_file = max(SIZES[size] // count, 1)
+        ratio = len(unit.encode()) / len(unit)
+        chars = max(int(per_file / ratio), 1)
+        text = (unit * (chars // len(unit) + 1))[:chars]
+        contents = [text] * count
+
+        files: list[FileResponse] = [
+            {
+                "annotation": "",
+                "charcount": len(content),
+                "content": content,
+                "filename": f"file_{index}.py",
+                "loc": content.count("\n") + 1,
+                "parent_id": "BenchmarkPaste",
+            }
+            for index, content in enumerate(contents)
+        ]
+        response: GetPasteResponse = {
+            "id": "BenchmarkPaste",
+            "has_password": False,
+            "views": 42,
+            "created_at": "2024-01-01T12:00:00.123456+00:00",
+            "expires": "2030-01-01T12:00:00.123456+00:00",
+            "files": files,
+        }
+        body = json.dumps(response, ensure_ascii=False).encode()
+        return cls(
+            label=f"{size}-{count}f-{charset}",
+            contents=contents,
+            files=[
+                File(filename=f"file_{i}.py", content=content, cache_encoding=True) for i, content in enumerate(contents)
+            ],
+            response=response,
+            body=body,
+            http=HTTPClient(),
+        )
+
+
+class _Response:
+    """Stands in for :class:`aiohttp.ClientResponse`, exposing only what ``_json_or_text`` reads."""
+
+    __slots__ = ("_body",)
+
+    content_type = "application/json"
+
+    def __init__(self, body: bytes, /) -> None:
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+def _complete(coro: Coroutine[Any, Any, T], /) -> T:
+    # Drives a coroutine that never suspends without an event loop, keeping loop overhead out of the timings.
+    try:
+        coro.send(None)
+    except StopIteration as exc:
+        return exc.value
+    coro.close()
+    msg = "The benchmarked coroutine suspended."
+    raise RuntimeError(msg)
+
+
+BENCHMARKS: dict[str, Factory] = {}
+"""Benchmarks run once per payload, keyed by name."""
+
+
+def benchmark(name: str, /) -> Callable[[Factory], Factory]:
+    def decorator(factory: Factory) -> Factory:
+        BENCHMARKS[name] = factory
+        return factory
+
+    return decorator
+
+
+@benchmark("encode_paste")
+def _encode_cold(payload: Payload) -> Benchmark:
+    # Fresh files every call, as for a one-off upload.
+    contents = payload.contents
+
+    def run() -> bytes:
+        files = [File(filename=f"file_{i}.py", content=content) for i, content in enumerate(contents)]
+        return _encode_paste((files, {"password": "hunter2"}), dumps=to_json)
+
+    return run
+
+
+@benchmark("encode_paste_cached")
+def _encode_cached(payload: Payload) -> Benchmark:
+    # The same files posted repeatedly, as when fanning one upload out to many pastes.
+    files = payload.files
+    return functools.partial(_encode_paste, (files, {"password": "hunter2"}), dumps=to_json)
+
+
+def _decoders() -> Iterator[tuple[str, JSONLoads]]:
+    yield "json", json.loads
+    if orjson is not None:
+        yield "orjson", orjson.loads
+    if msgspec is not None:
+        decoder = msgspec.json.Decoder()
+        yield "msgspec", decoder.decode
+        yield "msgspec-typed", functools.partial(decode_typed, "get_paste", decoder.decode)
+
+
+def _decode(loads: JSONLoads, /) -> Factory:
+    def factory(payload: Payload) -> Benchmark:
+        body = payload.body
+        return lambda: _complete(_json_or_text(_Response(body), loads=loads))  # pyright: ignore[reportArgumentType]
+
+    return factory
+
+
+for _name, _loads in _decoders():
+    benchmark(f"decode[{_name}]")(_decode(_loads))
+
+
+@benchmark("decode_offloaded")
+def _decode_offloaded(payload: Payload) -> Benchmark:
+    # The cost of handing the decode to a thread, to weigh against the event loop time it frees.
+    body = payload.body
+    loop = asyncio.new_event_loop()
+    executor = ThreadPoolExecutor(1)
+
+    def run() -> Any:
+        return loop.run_until_complete(
+            _json_or_text(_Response(body), offload_threshold=0, executor=executor)  # pyright: ignore[reportArgumentType]
+        )
+
+    return run
+
+
+@benchmark("file_from_data")
+def _file_from_data(payload: Payload) -> Benchmark:
+    files = payload.response["files"]
+    return lambda: [File.from_data(data) for data in files]
+
+
+@benchmark("paste_from_get")
+def _paste_from_get(payload: Payload) -> Benchmark:
+    return functools.partial(Paste.from_get, payload.response, http=payload.http)
+
+
+@benchmark("paste_from_get_lazy")
+def _paste_from_get_lazy(payload: Payload) -> Benchmark:
+    return functools.partial(Paste.from_get, payload.response, http=payload.http, lazy=True)
+
+
+@benchmark("paste_from_get_lazy_full")
+def _paste_from_get_lazy_full(payload: Payload) -> Benchmark:
+    # Lazy construction followed by touching everything, the worst case for lazy mode.
+    response, http = payload.response, payload.http
+
+    def run() -> Paste:
+        paste = Paste.from_get(response, http=http, lazy=True)
+        _ = paste.created_at, paste.expires, list(paste.files)
+        return paste
+
+    return run
+
+
+STANDALONE: dict[str, Benchmark] = {
+    "route": functools.partial(Route, "GET", "/paste/{paste_id}", api_base=Route.API_BASE, paste_id="SomePasteID"),
+    "route_no_params": functools.partial(Route, "POST", "/paste", api_base=Route.API_BASE),
+}
+"""Benchmarks that do not depend on a payload."""
+
+
+def names(sizes: list[str], counts: list[int], charsets: list[str], /) -> Iterator[str]:
+    """Yield the name of every benchmark, without building any payloads.
+
+    Yields
+    ------
+    :class:`str`
+        The name of a benchmark.
+    """
+    yield from STANDALONE
+    for size in sizes:
+        for count in counts:
+            for charset in charsets:
+                for key in BENCHMARKS:
+                    yield f"{key}/{size}-{count}f-{charset}"
+
+
+def collect(
+    sizes: list[str], counts: list[int], charsets: list[str], /, *, select: Callable[[str], bool]
+) -> Iterator[tuple[str, Benchmark]]:
+    """Yield ``(name, benchmark)`` pairs, building each payload only if one of its benchmarks is selected.
+
+    Payloads are built one at a time and dropped once their benchmarks have run, to bound memory use.
+
+    Yields
+    ------
+    Tuple[:class:`str`, Callable[[], Any]]
+        The name of a benchmark and the callable to time.
+    """
+    for name, bench in STANDALONE.items():
+        if select(name):
+            yield name, bench
+
+    for size in sizes:
+        for count in counts:
+            for charset in charsets:
+                label = f"{size}-{count}f-{charset}"
+                names = {key: f"{key}/{label}" for key in BENCHMARKS}
+                selected = [key for key, name in names.items() if select(name)]
+                if not selected:
+                    continue
+
+                payload = Payload.build(size, count, charset)
+                for key in selected:
+                    yield names[key], BENCHMARKS[key](payload)
+                del payload
@@ -0,0 +1,315 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import collections
+import json
+import logging
+import math
+import pathlib
+import random
+import sys
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import mystbin
+
+from .cases import CHARSETS, SIZES
+from .server import StandIn, fault_arguments, faults_from
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__ = (
+    "LoadReport",
+    "OperationStats",
+    "run_load",
+)
+
+OPERATIONS: tuple[str, ...] = ("get", "create", "delete")
+
+
+class OperationStats(NamedTuple):
+    """The outcome of one kind of operation over a load run, latencies being in seconds."""
+
+    count: int
+    errors: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class LoadReport(NamedTuple):
+    """The outcome of a load run."""
+
+    duration: float
+    operations: dict[str, OperationStats]
+    errors: dict[str, int]
+    routes: tuple[mystbin.RouteStats, ...]
+
+    @property
+    def throughput(self) -> float:
+        """Successful operations per second."""
+        return sum(stats.count - stats.errors for stats in self.operations.values()) / self.duration
+
+
+def _percentile(ordered: list[float], fraction: float, /) -> float:
+    # Nearest-rank, so the result is always an observed latency.
+    if not ordered:
+        return math.nan
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+async def run_load(  # noqa: C901, PLR0913, PLR0915
+    client: mystbin.Client,
+    /,
+    *,
+    concurrency: int,
+    duration: float,
+    mix: dict[str, float],
+    files: Sequence[mystbin.File],
+    timeout: float | None = None,
+    seed: int | None = None,
+    prefill: int = 20,
+) -> LoadReport:
+    """Run ``concurrency`` workers issuing a random ``mix`` of operations through ``client`` for ``duration`` seconds.
+
+    ``client`` must have a :class:`~mystbin.MetricsRegistry`, which the retry and ratelimit counts are read from.
+    Created pastes are fetched and deleted by later operations, and ``prefill`` pastes are created beforehand
+    so there is something to fetch from the start.
+
+    Returns
+    -------
+    :class:`LoadReport`
+
+    Raises
+    ------
+    ValueError
+        ``client`` has no metrics registry.
+    """
+    registry = client.metrics
+    if registry is None:
+        msg = "The client needs a MetricsRegistry to report retries."
+        raise ValueError(msg)
+
+    pastes: list[tuple[str, str]] = []
+    for _ in range(prefill):
+        paste = await client.create_paste(files=files)
+        pastes.append((paste.id, paste.security_token or ""))
+    registry.reset()
+
+    operations = [op for op in OPERATIONS if mix.get(op)]
+    weights = [mix[op] for op in operations]
+    latencies: dict[str, list[float]] = {op: [] for op in operations}
+    failures: collections.Counter[str] = collections.Counter()
+    failed: collections.Counter[str] = collections.Counter()
+    # Pastes with a get in flight, which are not deleted so gets only fail because of the server.
+    busy: collections.Counter[str] = collections.Counter()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration
+
+    async def worker(index: int) -> None:
+        rng = random.Random(None if seed is None else seed + index)  # noqa: S311
+        while loop.time() < deadline:
+            op = rng.choices(operations, weights)[0]
+            if op != "create" and not pastes:
+                op = "create"
+            position = rng.randrange(len(pastes)) if pastes else 0
+            if op == "delete" and busy[pastes[position][0]]:
+                op = "get"
+
+            started = time.perf_counter()
+            try:
+                if op == "create":
+                    paste = await client.create_paste(files=files, timeout=timeout)
+                    pastes.append((paste.id, paste.security_token or ""))
+                elif op == "get":
+                    paste_id = pastes[position][0]
+                    busy[paste_id] += 1
+                    try:
+                        await client.get_paste(paste_id, timeout=timeout)
+                    finally:
+                        busy[paste_id] -= 1
+                else:
+                    # Swap-remove, so it is no longer picked for gets while being deleted.
+                    pastes[position], pastes[-1] = pastes[-1], pastes[position]
+                    await client.delete_paste(pastes.pop()[1], timeout=timeout)
+            except Exception as exc:  # noqa: BLE001
+                failed[op] += 1
+                status = getattr(exc, "status_code", None)
+                failures[f"{op}: {type(exc).__name__}{f' {status}' if status else ''}"] += 1
+            latencies.setdefault(op, []).append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    stats: dict[str, OperationStats] = {}
+    for op, samples in latencies.items():
+        samples.sort()
+        stats[op] = OperationStats(
+            count=len(samples),
+            errors=failed[op],
+            p50=_percentile(samples, 0.5),
+            p90=_percentile(samples, 0.9),
+            p99=_percentile(samples, 0.99),
+            max=samples[-1] if samples else math.nan,
+        )
+
+    return LoadReport(duration=elapsed, operations=stats, errors=dict(failures), routes=registry.snapshot())
+
+
+def _ms(seconds: float, /) -> str:
+    return "-" if math.isnan(seconds) else f"{seconds * 1000:.1f}ms"
+
+
+def _render(report: LoadReport, /) -> str:
+    lines = [
+        f"{'operation':<10} {'count':>8} {'errors':>7} {'p50':>10} {'p90':>10} {'p99':>10} {'max':>10}",
+    ]
+    lines.extend(
+        f"{op:<10} {s.count:>8} {s.errors:>7} {_ms(s.p50):>10} {_ms(s.p90):>10} {_ms(s.p99):>10} {_ms(s.max):>10}"
+        for op, s in report.operations.items()
+    )
+    lines.append(f"\nThroughput: {report.throughput:.1f} successful operations/s over {report.duration:.1f}s")
+
+    if report.errors:
+        lines.append("\nErrors:")
+        lines.extend(f"  {name}: {count}" for name, count in sorted(report.errors.items(), key=lambda item: -item[1]))
+
+    lines.append("\nRequests:")
+    for route in report.routes:
+        statuses = ", ".join(f"{status}: {count}" for status, count in sorted(route.responses.items()))
+        lines.append(
+            f"  {route.method} {route.path}: {route.requests} requests, {route.retries} retries, "
+            f"{route.ratelimited} ratelimited, {route.ratelimit_wait:.1f}s waiting on the ratelimit ({statuses})"
+        )
+    return "\n".join(lines)
+
+
+def _mix(value: str, /) -> dict[str, float]:
+    mix: dict[str, float] = {}
+    for item in value.split(","):
+        op, _, weight = item.partition("=")
+        if op.strip() not in OPERATIONS:
+            msg = f"Unknown operation {op!r}, expected one of {', '.join(OPERATIONS)}."
+            raise argparse.ArgumentTypeError(msg)
+        mix[op.strip()] = float(weight or 1)
+    return mix
+
+
+async def _main(args: argparse.Namespace, /) -> LoadReport:
+    stand_in: StandIn | None = None
+    url: str = args.url
+    if url is None:
+        stand_in = StandIn(faults=faults_from(args), limit=args.limit, window=args.window, seed=args.seed)
+        url = await stand_in.start()
+
+    unit = CHARSETS[args.charset]
+    per_file = SIZES[args.size] // args.files
+    content = (unit * (per_file // len(unit.encode()) + 1))[:per_file]
+    # Every paste re-posts the same files.
+    files = [mystbin.File(filename=f"load_{index}.txt", content=content, cache_encoding=True) for index in range(args.files)]
+
+    client = mystbin.Client(
+        root_url=url,
+        metrics=mystbin.MetricsRegistry(),
+        retry_policy=mystbin.RetryPolicy(attempts=args.attempts, max_backoff=args.max_backoff),
+        circuit_breaker=mystbin.CircuitBreaker() if args.breaker else None,
+    )
+    target = "the local stand-in" if stand_in is not None else url
+    profile = f" with the {args.profile!r} profile" if stand_in is not None else ""
+    sys.stdout.write(f"Running {args.concurrency} workers against {target}{profile} for {args.duration:.0f}s...\n")
+    sys.stdout.flush()
+    try:
+        report = await run_load(
+            client,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            mix=args.mix,
+            files=files,
+            timeout=args.timeout,
+            seed=args.seed,
+        )
+    finally:
+        await client.close()
+        if stand_in is not None:
+            await stand_in.stop()
+
+    sys.stdout.write(_render(report) + "\n")
+    if stand_in is not None:
+        sys.stdout.write(f"\nServer: {dict(stand_in.stats)}\n")
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load",
+        description="Drive concurrent Client workloads against a local mystbin stand-in, or any mystbin instance.",
+    )
+    parser.add_argument("--url", help="Target this instance instead of starting a local stand-in.")
+    parser.add_argument("-c", "--concurrency", type=int, default=20, help="Concurrent workers. Default: 20.")
+    parser.add_argument("-d", "--duration", type=float, default=10.0, help="Seconds to run for. Default: 10.")
+    parser.add_argument(
+        "--mix",
+        type=_mix,
+        default=_mix("get=8,create=1,delete=1"),
+        help="Operation weights. Default: get=8,create=1,delete=1.",
+    )
+    parser.add_argument("--size", choices=SIZES, default="1KB", help="Size of each created paste. Default: 1KB.")
+    parser.add_argument("--files", type=int, default=1, help="Files per created paste. Default: 1.")
+    parser.add_argument("--charset", choices=CHARSETS, default="ascii", help="Paste content. Default: ascii.")
+    parser.add_argument("--timeout", type=float, help="Timeout of each operation, in seconds.")
+    parser.add_argument("--attempts", type=int, default=5, help="RetryPolicy attempts. Default: 5.")
+    parser.add_argument("--max-backoff", type=float, default=30.0, help="RetryPolicy max_backoff. Default: 30.")
+    parser.add_argument("--breaker", action="store_true", help="Give the client a CircuitBreaker.")
+    parser.add_argument("--seed", type=int, help="Seed the workers and the stand-in's fault injection.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show the client's retry and ratelimit logs.")
+    parser.add_argument("--json", type=pathlib.Path, metavar="PATH", help="Also write the report to this file.")
+    stand_in = parser.add_argument_group("stand-in", "Options of the local stand-in, ignored with --url.")
+    stand_in.add_argument("--limit", type=int, default=1000, help="Requests per route per window. Default: 1000.")
+    stand_in.add_argument("--window", type=int, default=1, help="Ratelimit window in seconds. Default: 1.")
+    fault_arguments(stand_in)
+    args = parser.parse_args(argv)
+    if not args.verbose:
+        # Retries are expected under injected faults, and are summarised in the report instead.
+        logging.getLogger("mystbin").setLevel(logging.CRITICAL)
+
+    report = asyncio.run(_main(args))
+    if args.json is not None:
+        data: dict[str, Any] = {
+            "duration": report.duration,
+            "throughput": report.throughput,
+            "operations": {op: stats._asdict() for op, stats in report.operations.items()},
+            "errors": report.errors,
+            "routes": [route._asdict() for route in report.routes],
+        }
+        args.json.write_text(json.dumps(data, indent=2, default=str))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
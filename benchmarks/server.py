@@ -0,0 +1,382 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import collections
+import datetime
+import json
+import math
+import random
+import secrets
+import sys
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from aiohttp import web
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+__all__ = (
+    "PROFILES",
+    "Faults",
+    "StandIn",
+    "fault_arguments",
+    "faults_from",
+)
+
+
+class Faults(NamedTuple):
+    """The faults a :class:`StandIn` injects, all disabled by default.
+
+    Attributes
+    ----------
+    latency: :class:`float`
+        Seconds every response is delayed by, emulating the network.
+    slow_rate: :class:`float`
+        The chance of a response being delayed by a further ``slow_delay`` seconds.
+    slow_delay: :class:`float`
+        How long slow responses take, in seconds.
+    error_rate: :class:`float`
+        The chance of a request starting a burst of ``5xx`` responses.
+    burst_length: :class:`int`
+        How many consecutive requests a ``5xx`` burst fails.
+    disconnect_rate: :class:`float`
+        The chance of the connection being closed without a response.
+    storm_every: :class:`float`
+        Seconds between the starts of ``429`` storms, or ``0`` for no storms.
+    storm_duration: :class:`float`
+        How long each storm lasts, in seconds. Every request during a storm is ratelimited.
+    """
+
+    latency: float = 0.0
+    slow_rate: float = 0.0
+    slow_delay: float = 1.0
+    error_rate: float = 0.0
+    burst_length: int = 5
+    disconnect_rate: float = 0.0
+    storm_every: float = 0.0
+    storm_duration: float = 2.0
+
+
+PROFILES: dict[str, Faults] = {
+    "clean": Faults(latency=0.005),
+    "slow": Faults(latency=0.005, slow_rate=0.05, slow_delay=1.0),
+    "flaky": Faults(latency=0.005, error_rate=0.01, burst_length=5, disconnect_rate=0.01),
+    "storm": Faults(latency=0.005, storm_every=10.0, storm_duration=2.0),
+    "chaos": Faults(
+        latency=0.005,
+        slow_rate=0.02,
+        slow_delay=0.5,
+        error_rate=0.01,
+        burst_length=3,
+        disconnect_rate=0.005,
+        storm_every=10.0,
+        storm_duration=1.0,
+    ),
+}
+"""Named fault presets, from a healthy instance to one suffering every fault at once."""
+
+
+class _Paste(NamedTuple):
+    id: str
+    created_at: str
+    expires: str | None
+    password: str | None
+    files: list[dict[str, Any]]
+
+
+class StandIn:
+    """A local, in-memory stand-in for the mystb.in API, injecting faults on demand.
+
+    Serves ``POST /api/paste``, ``GET /api/paste/{paste_id}`` and ``GET /api/security/delete/{security_token}``
+    with the same payloads and ``x-ratelimit-*`` headers as mystb.in. Each route has its own fixed ratelimit window.
+
+    Parameters
+    ----------
+    faults: :class:`Faults`
+        The faults to inject. Defaults to none.
+    limit: :class:`int`
+        Requests allowed per route per ratelimit window. Defaults to ``1000``.
+    window: :class:`int`
+        The length of a ratelimit window, in whole seconds. Defaults to ``1``.
+    seed: Optional[:class:`int`]
+        Seeds the fault injection, to replay the same faults in the same order. Defaults to ``None``.
+    """
+
+    __slots__ = (
+        "_burst",
+        "_epoch",
+        "_pastes",
+        "_rng",
+        "_runner",
+        "_tokens",
+        "_windows",
+        "faults",
+        "limit",
+        "stats",
+        "window",
+    )
+
+    def __init__(self, *, faults: Faults = Faults(), limit: int = 1000, window: int = 1, seed: int | None = None) -> None:  # noqa: B008
+        self.faults: Faults = faults
+        self.limit: int = limit
+        self.window: int = window
+        self.stats: collections.Counter[str] = collections.Counter()
+        self._rng = random.Random(seed)  # noqa: S311
+        self._burst: int = 0
+        self._epoch: float = time.time()
+        self._pastes: dict[str, _Paste] = {}
+        self._tokens: dict[str, str] = {}
+        # Route -> (window reset epoch, requests seen in the window)
+        self._windows: dict[str, tuple[int, int]] = {}
+        self._runner: web.AppRunner | None = None
+
+    def __repr__(self) -> str:
+        return f"<StandIn pastes={len(self._pastes)} faults={self.faults!r}>"
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_cls: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    def app(self) -> web.Application:
+        """Build the :class:`aiohttp.web.Application` serving the API.
+
+        Returns
+        -------
+        :class:`aiohttp.web.Application`
+        """
+        app = web.Application(client_max_size=1 << 30, middlewares=[self._inject])
+        app.router.add_post("/api/paste", self._create)
+        app.router.add_get("/api/paste/{paste_id}", self._get)
+        app.router.add_get("/api/security/delete/{token}", self._delete)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving, on a free port unless one is given.
+
+        Returns
+        -------
+        :class:`str`
+            The root URL to pass to :class:`~mystbin.Client`.
+        """
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _ratelimit_headers(self, route: str, now: float, /) -> tuple[dict[str, str], bool]:
+        reset, seen = self._windows.get(route, (0, 0))
+        if now >= reset:
+            reset, seen = math.floor(now / self.window) * self.window + self.window, 0
+        seen += 1
+        self._windows[route] = (reset, seen)
+
+        headers = {
+            "x-ratelimit-limit": str(self.limit),
+            "x-ratelimit-remaining": str(max(self.limit - seen, 0)),
+            "x-ratelimit-retry-after": str(reset),
+        }
+        return headers, seen > self.limit
+
+    def _storm_ends(self, now: float, /) -> float | None:
+        every = self.faults.storm_every
+        if not every:
+            return None
+        elapsed = now - self._epoch
+        # The first storm starts one period in, leaving time to warm up.
+        if elapsed < every or elapsed % every >= self.faults.storm_duration:
+            return None
+        return now - elapsed % every + self.faults.storm_duration
+
+    @web.middleware
+    async def _inject(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        faults, rng = self.faults, self._rng
+        self.stats["requests"] += 1
+        resource = request.match_info.route.resource
+        route = request.path if resource is None else resource.canonical
+
+        if faults.disconnect_rate and rng.random() < faults.disconnect_rate:
+            self.stats["disconnects"] += 1
+            if request.transport is not None:
+                request.transport.close()
+            return web.Response(status=500)
+
+        now = time.time()
+        headers, limited = self._ratelimit_headers(route, now)
+        storm = self._storm_ends(now)
+        if storm is not None:
+            headers["x-ratelimit-remaining"] = "0"
+            headers["x-ratelimit-retry-after"] = str(math.ceil(storm))
+            limited = True
+
+        if faults.latency:
+            await asyncio.sleep(faults.latency)
+        if faults.slow_rate and rng.random() < faults.slow_rate:
+            self.stats["slow"] += 1
+            await asyncio.sleep(faults.slow_delay)
+
+        if limited:
+            response: web.StreamResponse = web.json_response({"error": "You are being ratelimited."}, status=429)
+        elif self._burst or (faults.error_rate and rng.random() < faults.error_rate):
+            self._burst = (self._burst or faults.burst_length) - 1
+            response = web.json_response({"error": "Injected failure."}, status=rng.choice((500, 502, 503, 504)))
+        else:
+            response = await handler(request)
+
+        response.headers.update(headers)
+        self.stats[str(response.status)] += 1
+        return response
+
+    async def _create(self, request: web.Request) -> web.Response:
+        try:
+            body = json.loads(await request.read())
+            files = [{"filename": str(file["filename"]), "content": str(file["content"])} for file in body["files"]]
+        except (ValueError, KeyError, TypeError):
+            return web.json_response({"error": "Invalid paste body."}, status=400)
+        if not files:
+            return web.json_response({"error": "A paste needs at least one file."}, status=400)
+
+        paste_id = f"StandIn{secrets.token_hex(6)}"
+        token = secrets.token_urlsafe(32)
+        paste = _Paste(
+            id=paste_id,
+            created_at=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            expires=body.get("expires"),
+            password=body.get("password"),
+            files=[
+                {
+                    "annotation": "",
+                    "charcount": len(file["content"]),
+                    "content": file["content"],
+                    "filename": file["filename"],
+                    "loc": file["content"].count("\n") + 1,
+                    "parent_id": paste_id,
+                }
+                for file in files
+            ],
+        )
+        self._pastes[paste_id] = paste
+        self._tokens[token] = paste_id
+        return web.json_response({"id": paste_id, "created_at": paste.created_at, "expires": paste.expires, "safety": token})
+
+    async def _get(self, request: web.Request) -> web.Response:
+        paste = self._pastes.get(request.match_info["paste_id"])
+        if paste is None:
+            return web.json_response({"error": "Unknown paste."}, status=404)
+        if paste.password is not None and request.query.get("password") != paste.password:
+            return web.json_response({"error": "Unauthorized."}, status=401)
+
+        self.stats["views"] += 1
+        return web.json_response(
+            {
+                "id": paste.id,
+                "has_password": paste.password is not None,
+                "views": self.stats["views"],
+                "created_at": paste.created_at,
+                "expires": paste.expires,
+                "files": paste.files,
+            }
+        )
+
+    async def _delete(self, request: web.Request) -> web.Response:
+        paste_id = self._tokens.pop(request.match_info["token"], None)
+        if paste_id is None:
+            return web.json_response({"error": "Unknown security token."}, status=404)
+
+        del self._pastes[paste_id]
+        return web.json_response({"deleted": paste_id})
+
+
+def fault_arguments(parser: argparse.ArgumentParser, /) -> None:
+    """Add the ``--profile`` option, and an option overriding each :class:`Faults` field, to ``parser``."""
+    parser.add_argument("--profile", choices=PROFILES, default="clean", help="The fault preset. Default: clean.")
+    for field, default in Faults._field_defaults.items():
+        parser.add_argument(f"--{field.replace('_', '-')}", type=type(default), help=f"Overrides the preset's {field}.")
+
+
+def faults_from(args: argparse.Namespace, /) -> Faults:
+    """Build the :class:`Faults` chosen by the options added by :func:`fault_arguments`.
+
+    Returns
+    -------
+    :class:`Faults`
+    """
+    overrides = {field: getattr(args, field) for field in Faults._fields if getattr(args, field) is not None}
+    return PROFILES[args.profile]._replace(**overrides)
+
+
+async def _serve(stand_in: StandIn, host: str, port: int, /) -> None:
+    url = await stand_in.start(host, port)
+    sys.stdout.write(f"Serving the mystbin stand-in at {url} with {stand_in.faults!r}\n")
+    sys.stdout.flush()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await stand_in.stop()
+        sys.stdout.write(f"Served: {dict(stand_in.stats)}\n")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.server",
+        description="Serve a local stand-in for the mystb.in API with injected faults.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--limit", type=int, default=1000, help="Requests per route per window. Default: 1000.")
+    parser.add_argument("--window", type=int, default=1, help="Ratelimit window in seconds. Default: 1.")
+    parser.add_argument("--seed", type=int, help="Seed the fault injection.")
+    fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    stand_in = StandIn(faults=faults_from(args), limit=args.limit, window=args.window, seed=args.seed)
+    try:
+        asyncio.run(_serve(stand_in, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
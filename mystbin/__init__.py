@@ -25,6 +25,18 @@ DEALINGS IN THE SOFTWARE.
 __version__ = "7.1.1"
 
 
+from .cache import CacheStats as CacheStats, PasteCache as PasteCache
 from .client import Client as Client
 from .errors import *
+from .metrics import MetricsRegistry as MetricsRegistry, RouteStats as RouteStats
 from .paste import File as File, Paste as Paste
+from .policies import CircuitBreaker as CircuitBreaker, RetryBudget as RetryBudget, RetryPolicy as RetryPolicy
+from .pool import ClientPool as ClientPool, PoolInstance as PoolInstance
+from .ratelimits import RateLimiter as RateLimiter
+from .streaming import DownloadedFile as DownloadedFile
+from .tracing import (
+    RatelimitWait as RatelimitWait,
+    RequestTrace as RequestTrace,
+    RetryEvent as RetryEvent,
+    TraceHooks as TraceHooks,
+)
@@ -0,0 +1,282 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import collections
+import datetime
+import hashlib
+import time
+from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple
+
+from .paste import _LazyFiles  # pyright: ignore[reportPrivateUsage]
+
+if TYPE_CHECKING:
+    from .paste import Paste
+
+    CacheKey = Tuple[str, Optional[bytes]]
+
+
+__all__ = (
+    "CacheStats",
+    "PasteCache",
+)
+
+# How many security tokens are remembered when the cache has no entry limit.
+_MAX_TOKENS: int = 1024
+
+
+class CacheStats(NamedTuple):
+    """A snapshot of a :class:`~mystbin.PasteCache`'s statistics.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        The amount of lookups served from the cache.
+    misses: :class:`int`
+        The amount of lookups not served from the cache.
+    evictions: :class:`int`
+        The amount of entries evicted to make room for new entries.
+    expirations: :class:`int`
+        The amount of entries dropped because their TTL passed.
+    entries: :class:`int`
+        The amount of pastes currently cached.
+    characters: :class:`int`
+        The total character count of the files currently cached.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    characters: int
+
+
+class _Entry(NamedTuple):
+    paste: Paste
+    characters: int
+    expires_at: float
+
+
+class PasteCache:
+    """An in-memory LRU cache for fetched pastes.
+
+    Entries are keyed by paste ID and a hash of the password used to fetch them,
+    and live for ``ttl`` seconds or until the paste expires, whichever is sooner.
+    The cache is bounded by the total character count of the cached files, as well as by entry count.
+
+    Cached :class:`~mystbin.Paste` instances are shared between lookups.
+
+    Parameters
+    ----------
+    max_characters: :class:`int`
+        The maximum total character count of the cached files.
+        Defaults to ``10_000_000``.
+    max_entries: Optional[:class:`int`]
+        The maximum amount of pastes to cache, if any.
+        Defaults to ``1024``.
+    ttl: :class:`float`
+        How long to cache a paste for, in seconds.
+        Defaults to ``300``.
+    """
+
+    __slots__ = (
+        "_characters",
+        "_entries",
+        "_evictions",
+        "_expirations",
+        "_hits",
+        "_ids",
+        "_misses",
+        "_tokens",
+        "max_characters",
+        "max_entries",
+        "ttl",
+    )
+
+    def __init__(self, *, max_characters: int = 10_000_000, max_entries: int | None = 1024, ttl: float = 300) -> None:
+        self.max_characters: int = max_characters
+        self.max_entries: int | None = max_entries
+        self.ttl: float = ttl
+        self._entries: collections.OrderedDict[CacheKey, _Entry] = collections.OrderedDict()
+        self._ids: dict[str, set[CacheKey]] = {}
+        self._tokens: collections.OrderedDict[str, str] = collections.OrderedDict()
+        self._characters: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._expirations: int = 0
+
+    def __repr__(self) -> str:
+        return f"<PasteCache entries={len(self._entries)} characters={self._characters}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of this cache's statistics.
+
+        Returns
+        -------
+        :class:`~mystbin.CacheStats`
+        """
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            entries=len(self._entries),
+            characters=self._characters,
+        )
+
+    @staticmethod
+    def _key(paste_id: str, password: str | None, /) -> CacheKey:
+        return (paste_id, hashlib.sha256(password.encode()).digest() if password else None)
+
+    def get(self, paste_id: str, /, *, password: str | None = None) -> Paste | None:
+        """Retrieve a paste from the cache.
+
+        Parameters
+        ----------
+        paste_id: :class:`str`
+            The ID of the paste.
+        password: Optional[:class:`str`]
+            The password the paste was fetched with, if any.
+
+        Returns
+        -------
+        Optional[:class:`~mystbin.Paste`]
+            The cached paste, if any.
+        """
+        key = self._key(paste_id, password)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.paste
+
+    def put(self, paste: Paste, /, *, password: str | None = None) -> None:
+        """Add a paste to the cache.
+
+        Pastes larger than ``max_characters``, or that have already expired, are not cached.
+
+        Parameters
+        ----------
+        paste: :class:`~mystbin.Paste`
+            The paste to cache.
+        password: Optional[:class:`str`]
+            The password the paste was fetched with, if any.
+        """
+        ttl = self.ttl
+        if paste.expires is not None:
+            ttl = min(ttl, (paste.expires - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+        # Fetched pastes are sized from their payload rather than creating every File.
+        files = paste.files
+        characters = files.character_count if isinstance(files, _LazyFiles) else sum(file.character_count for file in files)
+        if ttl <= 0 or characters > self.max_characters:
+            return
+
+        key = self._key(paste.id, password)
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = _Entry(paste, characters, time.monotonic() + ttl)
+        self._ids.setdefault(paste.id, set()).add(key)
+        self._characters += characters
+
+        while self._characters > self.max_characters or (
+            self.max_entries is not None and len(self._entries) > self.max_entries
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def track(self, paste: Paste, /) -> None:
+        """Remember a created paste's security token, so deleting by token invalidates it.
+
+        Only the tokens of the most recently created ``max_entries`` pastes are remembered,
+        or 1024 if ``max_entries`` is ``None``.
+
+        Parameters
+        ----------
+        paste: :class:`~mystbin.Paste`
+            The created paste.
+        """
+        if not paste.security_token:
+            return
+
+        self._tokens[paste.security_token] = paste.id
+        self._tokens.move_to_end(paste.security_token)
+        limit = _MAX_TOKENS if self.max_entries is None else self.max_entries
+        while len(self._tokens) > limit:
+            self._tokens.popitem(last=False)
+
+    def invalidate(self, paste_id: str, /) -> None:
+        """Remove every cached entry of a paste.
+
+        Parameters
+        ----------
+        paste_id: :class:`str`
+            The ID of the paste.
+        """
+        for key in self._ids.get(paste_id, set()).copy():
+            self._remove(key)
+
+    def invalidate_token(self, security_token: str, /) -> None:
+        """Remove every cached entry of a paste by its security token, if known.
+
+        Parameters
+        ----------
+        security_token: :class:`str`
+            The security token of the paste.
+        """
+        paste_id = self._tokens.pop(security_token, None)
+        if paste_id is not None:
+            self.invalidate(paste_id)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        self._entries.clear()
+        self._ids.clear()
+        self._tokens.clear()
+        self._characters = 0
+
+    def _remove(self, key: CacheKey, /) -> None:
+        entry = self._entries.pop(key)
+        self._characters -= entry.characters
+
+        keys = self._ids[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._ids[key[0]]
@@ -22,17 +22,37 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, Sequence, overload
+import asyncio
+import functools
+import os
+import pathlib
+import time
+from typing import TYPE_CHECKING, BinaryIO, Literal, Mapping, Optional, Sequence, Tuple, Union, overload
 
+from .errors import BulkRequestFailure
 from .http import HTTPClient
 from .paste import File, Paste
+from .streaming import DownloadedFile, FileObjectScanner, object_members, write_json_string
+from .utils import bounded_map
 
 if TYPE_CHECKING:
     import datetime
+    from collections.abc import AsyncIterable, AsyncIterator, Iterable
+    from concurrent.futures import Executor
     from types import TracebackType
 
     from aiohttp import ClientSession
-    from typing_extensions import Self
+    from typing_extensions import Buffer, Self
+
+    from .cache import PasteCache
+    from .metrics import MetricsRegistry
+    from .policies import CircuitBreaker, RetryPolicy
+    from .ratelimits import RateLimiter
+    from .tracing import TraceHooks
+    from .utils import JSONDumps, JSONLoads
+
+    PasteIdentifier = Union[str, Tuple[str, Optional[str]]]
+    PasteJob = Tuple[Sequence[File], Optional[str], Optional[datetime.datetime]]
 
 __all__ = ("Client",)
 
@@ -49,12 +69,130 @@ class Client:
     root_url: :class:`str`
         The root URL for the mystbin instance.
         Defaults to ``https://mystb.in``.
+    spread_requests: :class:`bool`
+        Whether to pace requests evenly across the ratelimit window rather than sending them
+        as soon as the ratelimit budget allows.
+        Defaults to ``False``.
+    cache: Optional[:class:`~mystbin.PasteCache`]
+        The cache to serve repeated :meth:`get_paste` calls from, if any.
+        Defaults to ``None``.
+    json_loads: Optional[Callable[[:class:`bytes`], Any]]
+        The function used to decode JSON responses from their raw bytes.
+        It must raise :exc:`ValueError` on invalid JSON.
+        Defaults to ``orjson`` or ``msgspec`` when installed, and :func:`json.loads` otherwise.
+    json_dumps: Optional[Callable[[Any], :class:`bytes`]]
+        The function used to encode JSON request bodies to compact UTF-8 bytes.
+        Defaults to ``orjson`` or ``msgspec`` when installed, and :func:`json.dumps` otherwise.
+    executor: Optional[:class:`concurrent.futures.Executor`]
+        The executor to encode and decode large bodies in, see ``offload_threshold``.
+        When using a process pool, ``json_loads`` and ``json_dumps`` must be picklable.
+        Defaults to the event loop's default executor.
+    offload_threshold: Optional[:class:`int`]
+        The body size, in bytes, from which request encoding and response decoding are moved off
+        the event loop into ``executor``. Timings for each phase are logged at ``DEBUG`` level.
+        Defaults to ``None``, never moving them.
+    compression: Optional[:class:`str`]
+        The ``Content-Encoding`` to compress request bodies with, one of ``"gzip"``,
+        ``"br"`` (requires ``brotli``) or ``"zstd"`` (requires ``zstandard``).
+        If the server rejects compressed bodies, compression is disabled and the request is resent.
+        Defaults to ``None``, sending bodies uncompressed.
+    compression_threshold: :class:`int`
+        The body size, in bytes, below which request bodies are not compressed.
+        Defaults to ``1024``.
+    lazy: :class:`bool`
+        Whether fetched pastes are thin views over the response, parsing their timestamps and
+        creating their :class:`~mystbin.File` objects only when first accessed.
+        Defaults to ``False``.
+    typed_decoding: :class:`bool`
+        Whether to decode and validate responses straight into compact ``msgspec`` structs
+        in a single pass, rather than into dicts. Requires ``msgspec``; without it, or for responses
+        that don't match the expected schema, responses are decoded as dicts.
+        Defaults to ``False``.
+    limit_per_host: :class:`int`
+        The maximum amount of simultaneous connections to the mystbin instance, ``0`` for no limit.
+        Defaults to ``0``.
+    keepalive_timeout: :class:`float`
+        How long, in seconds, idle connections are kept open for reuse.
+        Defaults to ``15.0``.
+    ttl_dns_cache: Optional[:class:`int`]
+        How long, in seconds, resolved DNS entries are cached for. ``None`` caches them forever and ``0`` disables the cache.
+        Defaults to ``10``.
+    connect_timeout: Optional[:class:`float`]
+        How long, in seconds, to wait for a new connection to be established, ``None`` to wait indefinitely.
+        Defaults to ``30.0``.
+    read_timeout: Optional[:class:`float`]
+        How long, in seconds, to wait between reads of a response, ``None`` to wait indefinitely.
+        Defaults to ``None``.
+
+    retry_policy: Optional[:class:`~mystbin.RetryPolicy`]
+        The policy deciding whether and when failed requests are retried.
+        Defaults to a :class:`~mystbin.RetryPolicy` with its default settings.
+    circuit_breaker: Optional[:class:`~mystbin.CircuitBreaker`]
+        The circuit breaker making requests fail fast with :exc:`~mystbin.CircuitBreakerOpen`
+        while the mystbin instance is down, if any.
+        Defaults to ``None``.
+    hooks: Optional[:class:`~mystbin.TraceHooks`]
+        Callbacks notified of each request's phases and timings, if any.
+        Defaults to ``None``.
+    metrics: Optional[:class:`~mystbin.MetricsRegistry`]
+        The registry to record per route request counts, statuses, retries, bytes and latencies in, if any.
+        Defaults to ``None``.
+
+    .. note::
+
+        The connection settings only apply to the session the client creates, not one passed as ``session``.
     """
 
-    __slots__ = ("http",)
+    __slots__ = ("_lazy", "http")
 
-    def __init__(self, *, session: ClientSession | None = None, root_url: str = "https://mystb.in") -> None:
-        self.http: HTTPClient = HTTPClient(session=session, root_url=root_url)
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        session: ClientSession | None = None,
+        root_url: str = "https://mystb.in",
+        spread_requests: bool = False,
+        cache: PasteCache | None = None,
+        json_loads: JSONLoads | None = None,
+        json_dumps: JSONDumps | None = None,
+        executor: Executor | None = None,
+        offload_threshold: int | None = None,
+        compression: str | None = None,
+        compression_threshold: int = 1024,
+        lazy: bool = False,
+        typed_decoding: bool = False,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: int | None = 10,
+        connect_timeout: float | None = 30.0,
+        read_timeout: float | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hooks: TraceHooks | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self._lazy: bool = lazy
+        self.http: HTTPClient = HTTPClient(
+            session=session,
+            root_url=root_url,
+            spread_requests=spread_requests,
+            cache=cache,
+            json_loads=json_loads,
+            json_dumps=json_dumps,
+            executor=executor,
+            offload_threshold=offload_threshold,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            typed_decoding=typed_decoding,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=ttl_dns_cache,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            hooks=hooks,
+            metrics=metrics,
+        )
 
     async def __aenter__(self) -> Self:
         return self
@@ -67,6 +205,38 @@ class Client:
     ) -> None:
         await self.close()
 
+    @property
+    def cache(self) -> PasteCache | None:
+        """The cache serving :meth:`get_paste` calls, if any.
+
+        Returns
+        -------
+        Optional[:class:`~mystbin.PasteCache`]
+        """
+        return self.http.cache
+
+    @property
+    def metrics(self) -> MetricsRegistry | None:
+        """The registry this client's requests are recorded in, if any.
+
+        Returns
+        -------
+        Optional[:class:`~mystbin.MetricsRegistry`]
+        """
+        return self.http.metrics
+
+    @property
+    def ratelimits(self) -> Mapping[str, RateLimiter]:
+        """A read-only mapping of route paths to the ratelimiter tracking their budget.
+
+        Ratelimiters are created as routes are first requested.
+
+        Returns
+        -------
+        Mapping[:class:`str`, :class:`~mystbin.RateLimiter`]
+        """
+        return self.http.ratelimiters
+
     async def close(self) -> None:
         """|coro|
 
@@ -74,12 +244,29 @@ class Client:
         """
         await self.http.close()
 
+    async def warm_up(self, connections: int = 1, /) -> None:
+        """|coro|
+
+        Opens connections to the mystbin instance ahead of time, so the first requests
+        made after startup don't wait on DNS resolution and connection setup.
+
+        The connections are kept for reuse for up to ``keepalive_timeout`` seconds while idle.
+        If a connection can't be established, the :exc:`aiohttp.ClientError` is raised.
+
+        Parameters
+        ----------
+        connections: :class:`int`
+            How many connections to open. Defaults to ``1``.
+        """
+        await self.http.warm_up(connections)
+
     async def create_paste(
         self,
         *,
         files: Sequence[File],
         password: str | None = None,
         expires: datetime.datetime | None = None,
+        timeout: float | None = None,
     ) -> Paste:
         """|coro|
 
@@ -93,16 +280,95 @@ class Client:
             The password of the paste, if any.
         expires: Optional[:class:`datetime.datetime`]
             When the paste expires, if any.
+        timeout: Optional[:class:`float`]
+            The most seconds to spend on the call, including waiting on the ratelimit and retries,
+            after which :exc:`asyncio.TimeoutError` is raised. Defaults to ``None``, no limit.
 
         Returns
         -------
         :class:`mystbin.Paste`
             The paste that was created.
         """
-        data = await self.http.create_paste(files=files, password=password, expires=expires)
-        return Paste.from_create(data, files=files, http=self.http)
+        data = await self.http.create_paste(files=files, password=password, expires=expires, timeout=timeout)
+        paste = Paste.from_create(data, files=files, http=self.http)
+        if self.http.cache is not None:
+            self.http.cache.track(paste)
+        return paste
+
+    @overload
+    def create_pastes(
+        self,
+        jobs: Iterable[PasteJob] | AsyncIterable[PasteJob],
+        /,
+        *,
+        concurrency: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> AsyncIterator[Paste]: ...
+
+    @overload
+    def create_pastes(
+        self,
+        jobs: Iterable[PasteJob] | AsyncIterable[PasteJob],
+        /,
+        *,
+        concurrency: int = ...,
+        return_exceptions: Literal[True],
+    ) -> AsyncIterator[Paste | BulkRequestFailure]: ...
+
+    async def create_pastes(
+        self,
+        jobs: Iterable[PasteJob] | AsyncIterable[PasteJob],
+        /,
+        *,
+        concurrency: int = 10,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Paste | BulkRequestFailure]:
+        """Create many pastes concurrently, yielding them as they are created.
+
+        Jobs are consumed lazily, so they can be produced as they become available,
+        and uploads are pipelined within the ratelimit budget.
+
+        .. code-block:: python3
+
+            jobs = ((files, None, None) for files in batches)
+            async for paste in client.create_pastes(jobs):
+                print(paste.url, paste.security_token)
+
+        Parameters
+        ----------
+        jobs: Union[Iterable, AsyncIterable]
+            The pastes to create, as ``(files, password, expires)`` tuples.
+        concurrency: :class:`int`
+            The maximum amount of pastes to create at once.
+            Defaults to ``10``.
+        return_exceptions: :class:`bool`
+            Whether to yield a :class:`~mystbin.BulkRequestFailure` for jobs that failed rather than raising it.
+            Defaults to ``False``.
+
+        Yields
+        ------
+        Union[:class:`~mystbin.Paste`, :class:`~mystbin.BulkRequestFailure`]
+            The created pastes, including their security tokens, in the order they were created.
+
+        Raises
+        ------
+        BulkRequestFailure
+            A paste could not be created and ``return_exceptions`` is ``False``.
+        """
 
-    async def delete_paste(self, security_token: str, /) -> None:
+        async def create(job: PasteJob) -> Paste:
+            files, password, expires = job
+            return await self.create_paste(files=files, password=password, expires=expires)
+
+        async for job, result in bounded_map(create, jobs, concurrency=concurrency):
+            if isinstance(result, Exception):
+                if not return_exceptions:
+                    raise BulkRequestFailure(job, result) from result
+                yield BulkRequestFailure(job, result)
+            else:
+                yield result
+
+    async def delete_paste(self, security_token: str, /, *, timeout: float | None = None) -> None:
         """|coro|
 
         Delete a paste.
@@ -111,19 +377,30 @@ class Client:
         ----------
         security_token: :class:`str`
             The security token relating to the paste to delete.
+        timeout: Optional[:class:`float`]
+            The most seconds to spend on the call, including waiting on the ratelimit and retries,
+            after which :exc:`asyncio.TimeoutError` is raised. Defaults to ``None``, no limit.
         """
-        await self.http.delete_paste(security_token)
+        await self.http.delete_paste(security_token, timeout=timeout)
+        if self.http.cache is not None:
+            self.http.cache.invalidate_token(security_token)
 
     @overload
-    async def get_paste(self, paste_id: str, *, password: str | None = ..., raw: Literal[False]) -> Paste: ...
+    async def get_paste(
+        self, paste_id: str, *, password: str | None = ..., raw: Literal[False], timeout: float | None = ...
+    ) -> Paste: ...
 
     @overload
-    async def get_paste(self, paste_id: str, *, password: str | None = ..., raw: Literal[True]) -> list[str]: ...
+    async def get_paste(
+        self, paste_id: str, *, password: str | None = ..., raw: Literal[True], timeout: float | None = ...
+    ) -> list[str]: ...
 
     @overload
-    async def get_paste(self, paste_id: str, *, password: str | None = ...) -> Paste: ...
+    async def get_paste(self, paste_id: str, *, password: str | None = ..., timeout: float | None = ...) -> Paste: ...
 
-    async def get_paste(self, paste_id: str, *, password: str | None = None, raw: bool = False) -> Paste | list[str]:
+    async def get_paste(
+        self, paste_id: str, *, password: str | None = None, raw: bool = False, timeout: float | None = None
+    ) -> Paste | list[str]:
         """|coro|
 
         Fetch a paste.
@@ -137,13 +414,227 @@ class Client:
         raw: :class:`bool`
             Whether to return the raw file(s) content or a :class:`~mystbin.Paste` instance.
             Defaults to ``False``.
+        timeout: Optional[:class:`float`]
+            The most seconds to spend on the call, including waiting on the ratelimit and retries,
+            after which :exc:`asyncio.TimeoutError` is raised. Defaults to ``None``, no limit.
 
         Returns
         -------
         Union[:class:`~mystbin.Paste`, List[:class:`str`]]
             The paste data returned.
+            If a :attr:`cache` is set, this may be a previously fetched :class:`~mystbin.Paste` instance.
         """
-        data = await self.http.get_paste(paste_id=paste_id, password=password)
+        cache = self.http.cache
+        if cache is not None:
+            paste = cache.get(paste_id, password=password)
+            if paste is None:
+                data = await self.http.get_paste(paste_id=paste_id, password=password, timeout=timeout)
+                paste = Paste.from_get(data, http=self.http, lazy=self._lazy)
+                cache.put(paste, password=password)
+            return [file.content for file in paste.files] if raw else paste
+
+        data = await self.http.get_paste(paste_id=paste_id, password=password, timeout=timeout)
         if raw:
             return [item["content"] for item in data["files"]]
-        return Paste.from_get(data, http=self.http)
+        return Paste.from_get(data, http=self.http, lazy=self._lazy)
+
+    @overload
+    def get_pastes(
+        self,
+        paste_ids: Iterable[PasteIdentifier] | AsyncIterable[PasteIdentifier],
+        /,
+        *,
+        concurrency: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> AsyncIterator[Paste]: ...
+
+    @overload
+    def get_pastes(
+        self,
+        paste_ids: Iterable[PasteIdentifier] | AsyncIterable[PasteIdentifier],
+        /,
+        *,
+        concurrency: int = ...,
+        return_exceptions: Literal[True],
+    ) -> AsyncIterator[Paste | BulkRequestFailure]: ...
+
+    async def get_pastes(
+        self,
+        paste_ids: Iterable[PasteIdentifier] | AsyncIterable[PasteIdentifier],
+        /,
+        *,
+        concurrency: int = 10,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Paste | BulkRequestFailure]:
+        """Fetch many pastes concurrently, yielding them as they are received.
+
+        IDs are consumed lazily, so arbitrarily long (or endless) streams of IDs can be used.
+
+        .. code-block:: python3
+
+            async for paste in client.get_pastes(["id1", ("id2", "password")]):
+                print(paste.url)
+
+        Parameters
+        ----------
+        paste_ids: Union[Iterable, AsyncIterable]
+            The paste IDs to fetch. Password protected pastes can be given as ``(paste_id, password)`` tuples.
+        concurrency: :class:`int`
+            The maximum amount of pastes to fetch at once.
+            Defaults to ``10``.
+        return_exceptions: :class:`bool`
+            Whether to yield a :class:`~mystbin.BulkRequestFailure` for pastes that could not be fetched
+            rather than raising it.
+            Defaults to ``False``.
+
+        Yields
+        ------
+        Union[:class:`~mystbin.Paste`, :class:`~mystbin.BulkRequestFailure`]
+            The fetched pastes, in the order they were received.
+
+        Raises
+        ------
+        BulkRequestFailure
+            A paste could not be fetched and ``return_exceptions`` is ``False``.
+        """
+
+        async def fetch(item: PasteIdentifier) -> Paste:
+            paste_id, password = (item, None) if isinstance(item, str) else item
+            return await self.get_paste(paste_id, password=password)
+
+        async for item, result in bounded_map(fetch, paste_ids, concurrency=concurrency):
+            if isinstance(result, Exception):
+                if not return_exceptions:
+                    raise BulkRequestFailure(item, result) from result
+                yield BulkRequestFailure(item, result)
+            else:
+                yield result
+
+    async def iter_paste_files(self, paste_id: str, /, *, password: str | None = None) -> AsyncIterator[File]:
+        """Fetch a paste's files, yielding each one as soon as it has been received.
+
+        Unlike :meth:`get_paste`, the response is parsed as it arrives, so the first file is available
+        before the whole paste has been downloaded and only one file is held in memory at a time.
+
+        .. code-block:: python3
+
+            async for file in client.iter_paste_files("<paste id>"):
+                print(file.filename, file.character_count)
+
+        Parameters
+        ----------
+        paste_id: :class:`str`
+            The paste id to fetch.
+        password: Optional[:class:`str`]
+            The password of the paste, if any.
+
+        Yields
+        ------
+        :class:`~mystbin.File`
+            The paste's files, in order.
+        """
+        loads = self.http.loads_for("file")
+        response = await self.http.stream_paste(paste_id=paste_id, password=password)
+        try:
+            scanner = FileObjectScanner()
+            async for chunk in response.content.iter_any():
+                for raw in scanner.feed(chunk):
+                    yield File.from_data(loads(raw))
+                if scanner.done:
+                    break
+        finally:
+            response.release()
+
+    async def download_paste(
+        self,
+        paste_id: str,
+        destination: str | os.PathLike[str] | BinaryIO,
+        /,
+        *,
+        password: str | None = None,
+    ) -> list[DownloadedFile]:
+        """Download a paste's files straight to disk or into a writable binary buffer.
+
+        The content of each file is written as the UTF-8 bytes received from the API,
+        without being decoded into a :class:`str` first, as soon as that file has arrived.
+
+        .. code-block:: python3
+
+            for result in await client.download_paste("<paste id>", "downloads/"):
+                print(result.path, result.bytes_written, result.elapsed)
+
+        Parameters
+        ----------
+        paste_id: :class:`str`
+            The paste id to download.
+        destination: Union[:class:`str`, :class:`os.PathLike`, :class:`typing.BinaryIO`]
+            A directory to write each file into, named after the file, or a writable binary buffer
+            to write the files into one after another. Missing directories are created and
+            existing files of the same name are overwritten. Files whose names collide within the paste,
+            such as ``a/x.txt`` and ``b/x.txt``, have their index appended, e.g. ``x_1.txt``.
+        password: Optional[:class:`str`]
+            The password of the paste, if any.
+
+        Returns
+        -------
+        List[:class:`~mystbin.DownloadedFile`]
+            What was written for each of the paste's files, in order.
+        """
+        loop = asyncio.get_running_loop()
+        if isinstance(destination, (str, os.PathLike)):
+            target: pathlib.Path | BinaryIO = pathlib.Path(destination)
+            # Created off the event loop, like the files written into it.
+            await loop.run_in_executor(self.http.executor, functools.partial(target.mkdir, parents=True, exist_ok=True))
+        else:
+            target = destination
+
+        results: list[DownloadedFile] = []
+        taken: set[str] = set()
+
+        response = await self.http.stream_paste(paste_id=paste_id, password=password)
+        try:
+            scanner = FileObjectScanner()
+            async for chunk in response.content.iter_any():
+                for raw in scanner.feed(chunk):
+                    members = object_members(raw)
+                    start, end = members[b"filename"]
+                    filename: str = self.http.json_loads(raw[start - 1 : end + 1])
+                    start, end = members[b"content"]
+                    content = memoryview(raw)[start:end]
+
+                    began = time.perf_counter()
+                    if isinstance(target, pathlib.Path):
+                        path = target / _safe_filename(filename, len(results), taken)
+                        write = functools.partial(_write_file, path, content)
+                        written = await loop.run_in_executor(self.http.executor, write)
+                    else:
+                        path = None
+                        written = write_json_string(content, target.write)
+
+                    results.append(DownloadedFile(filename, path, written, time.perf_counter() - began))
+
+                if scanner.done:
+                    break
+        finally:
+            response.release()
+
+        return results
+
+
+def _safe_filename(filename: str, index: int, taken: set[str], /) -> str:
+    name = pathlib.PurePath(filename.replace("\\", "/")).name
+    if name in {"", ".", ".."}:
+        name = f"file_{index}"
+
+    # Compared case-insensitively, as the names may differ only in case on a case-insensitive filesystem.
+    path, suffix = pathlib.PurePath(name), index
+    while name.casefold() in taken:
+        name = f"{path.stem}_{suffix}{path.suffix}"
+        suffix += 1
+    taken.add(name.casefold())
+    return name
+
+
+def _write_file(path: pathlib.Path, content: Buffer, /) -> int:
+    with path.open("wb") as fp:
+        return write_json_string(content, fp.write)
@@ -20,11 +20,15 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
+from typing import Any
+
 from aiohttp import ClientResponse
 
 __all__ = (
     "APIException",
     "AuthenticationRequired",
+    "BulkRequestFailure",
+    "CircuitBreakerOpen",
 )
 
 
@@ -45,3 +49,34 @@ class APIException(Exception):
 
 class AuthenticationRequired(Exception):
     """An exception to be raised when authentication is required to use this endpoint."""
+
+
+class BulkRequestFailure(Exception):
+    """An exception raised or returned when a single item of a bulk request fails.
+
+    Attributes
+    ----------
+    item: Any
+        The item that failed, e.g. the paste ID.
+    original: :class:`Exception`
+        The exception that caused the failure.
+    """
+
+    def __init__(self, item: Any, original: Exception) -> None:
+        self.item: Any = item
+        self.original: Exception = original
+        super().__init__(f"Bulk request failed for {item!r}: {original!r}")
+
+
+class CircuitBreakerOpen(Exception):
+    """An exception raised instead of making a request while the client's circuit breaker is open.
+
+    Attributes
+    ----------
+    retry_after: :class:`float`
+        Roughly how many seconds until the circuit breaker lets a request through to probe for recovery.
+    """
+
+    def __init__(self, retry_after: float) -> None:
+        self.retry_after: float = retry_after
+        super().__init__(f"The circuit breaker is open, retry in {retry_after:.2f}s")
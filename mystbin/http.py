@@ -24,35 +24,44 @@ from __future__ import annotations
 
 import asyncio
 import datetime
-import json
+import functools
 import logging
 import sys
-import weakref
+import time
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    Callable,
     ClassVar,
     Coroutine,
     Literal,
+    Mapping,
     Sequence,
     TypeVar,
 )
 from urllib.parse import quote as _uriquote
 
 import aiohttp
-from typing_extensions import Self
 
 from . import __version__
 from .errors import APIException
+from .policies import CircuitBreaker, RetryPolicy
+from .ratelimits import RateLimiter
+from .tracing import RatelimitWait, RequestTrace, RetryEvent, TraceHooks, emit
+from .types_.structs import decode_typed
+from .utils import ACCEPT_ENCODING, COMPRESSORS, JSONDumps, JSONLoads, from_json, msgspec, to_json
 
 if TYPE_CHECKING:
-    from types import TracebackType
+    from concurrent.futures import Executor
 
     from . import File
+    from .cache import PasteCache
+    from .metrics import MetricsRegistry, RouteMetrics
 
     T = TypeVar("T")
     Response = Coroutine[None, None, T]
-    MU = TypeVar("MU", bound="MaybeUnlock")
     from .types_.responses import CreatePasteResponse, GetPasteResponse
 
 
@@ -69,46 +78,170 @@ def _clean_dt(dt: datetime.datetime) -> str:
     return dt.isoformat()
 
 
-async def _json_or_text(response: aiohttp.ClientResponse, /) -> dict[str, Any] | str:
+async def _run_codec(  # noqa: PLR0913
+    func: Callable[[Any], T],
+    arg: Any,
+    /,
+    *,
+    phase: str,
+    size: int,
+    threshold: int | None,
+    executor: Executor | None,
+) -> T:
+    """Run an encoder or decoder, in an executor if ``size`` reaches ``threshold``, logging how long it took.
+
+    Returns
+    -------
+    Any
+        The result of ``func``.
+    """
+    offload = threshold is not None and size >= threshold
+    start = time.perf_counter()
+    if offload:
+        result = await asyncio.get_running_loop().run_in_executor(executor, func, arg)
+    else:
+        result = func(arg)
+
+    LOGGER.debug("%s %d bytes in %.2fms (offloaded: %s)", phase, size, (time.perf_counter() - start) * 1000, offload)
+    return result
+
+
+async def _json_or_text(  # noqa: PLR0913
+    response: aiohttp.ClientResponse,
+    /,
+    *,
+    loads: JSONLoads = from_json,
+    offload_threshold: int | None = None,
+    executor: Executor | None = None,
+    trace: RequestTrace | None = None,
+    metrics: RouteMetrics | None = None,
+) -> dict[str, Any] | str:
     """A quick method to parse a `aiohttp.ClientResponse` and test if it's json or text.
 
+    JSON is decoded straight from the response bytes, in ``executor`` if the body
+    is at least ``offload_threshold`` bytes.
+
     Returns
     -------
     Union[Dict[:class:`str`, Any], :class:`str`]
         The JSON object, or request text.
     """
-    text = await response.text(encoding="utf-8")
+    start = time.perf_counter()
+    body = await response.read()
+    if metrics is not None:
+        metrics.bytes_received += len(body)
+    if trace is not None:
+        decoded = time.perf_counter()
+        trace.network += decoded - start
+        trace.bytes_received += len(body)
+        start = decoded
+
     try:
-        if response.headers["content-type"] == "application/json":
+        # ``content_type`` is the bare mimetype, so ``application/json; charset=utf-8`` matches too.
+        if response.content_type == "application/json":
             try:
-                return json.loads(text)
-            except json.JSONDecodeError:
+                return await _run_codec(
+                    loads,
+                    body,
+                    phase="Decoded response body of",
+                    size=len(body),
+                    threshold=offload_threshold,
+                    executor=executor,
+                )
+            except ValueError:
                 pass
-    except KeyError:
-        pass
 
-    return text
+        return body.decode("utf-8", errors="replace")
+    finally:
+        if trace is not None:
+            trace.decode += time.perf_counter() - start
 
 
-class MaybeUnlock:
-    def __init__(self, lock: asyncio.Lock) -> None:
-        self.lock: asyncio.Lock = lock
-        self._unlock: bool = True
+class StreamedPasteBody:
+    """A ``create_paste`` JSON body streamed to aiohttp in chunks.
 
-    def __enter__(self) -> Self:
-        return self
+    File contents are read, escaped and sent a chunk at a time, so peak memory stays near a single chunk
+    rather than holding the whole file, its payload dict and the encoded body at once.
+    Each iteration starts a fresh stream, so the body can be resent on retries unless :attr:`replayable` is ``False``.
+    """
 
-    def defer(self) -> None:
-        self._unlock = False
+    __slots__ = (
+        "dumps",
+        "extra",
+        "files",
+    )
+
+    def __init__(self, files: Sequence[File], extra: dict[str, Any], *, dumps: JSONDumps) -> None:
+        self.files: Sequence[File] = files
+        self.extra: dict[str, Any] = extra
+        self.dumps: JSONDumps = dumps
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._stream()
+
+    @property
+    def replayable(self) -> bool:
+        # Non-seekable file objects can only be streamed once.
+        return all(file.replayable for file in self.files)
+
+    async def _stream(self) -> AsyncIterator[bytes]:
+        dumps = self.dumps
+        yield b'{"files":['
+        for index, file in enumerate(self.files):
+            if index:
+                yield b","
+            if not file.streamed:
+                yield file.to_json(dumps)
+                continue
+
+            yield b'{"filename":' + dumps(file.filename) + b',"content":"'
+            for chunk in file.iter_content():
+                # Strip the quotes from the encoded string to splice it into the open content string.
+                yield dumps(chunk)[1:-1]
+            yield b'"}'
+
+        yield b"]"
+        for key, value in self.extra.items():
+            yield b"," + dumps(key) + b":" + dumps(value)
+        yield b"}"
 
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc: BaseException | None,
-        traceback: TracebackType | None,
-    ) -> None:
-        if self._unlock:
-            self.lock.release()
+
+def _replayable(body: object, /) -> bool:
+    # A streamed body of an already read, non-seekable file object would be resent empty.
+    return not isinstance(body, StreamedPasteBody) or body.replayable
+
+
+def _encode_paste(payload: tuple[Sequence[File], dict[str, Any]], /, *, dumps: JSONDumps) -> bytes:
+    # Splices each file's cached encoding into the body rather than encoding the files again.
+    files, extra = payload
+    parts = [b'{"files":[', b",".join([file.to_json(dumps) for file in files]), b"]"]
+    if extra:
+        # The encoded object without its opening brace continues the body.
+        parts.extend((b",", dumps(extra)[1:]))
+    else:
+        parts.append(b"}")
+    return b"".join(parts)
+
+
+class SharedRequest:
+    """A single in-flight request shared by every caller making the identical request."""
+
+    task: asyncio.Future[Any]
+
+    __slots__ = (
+        "deadline",
+        "task",
+        "waiters",
+    )
+
+    def __init__(self, deadline: float | None) -> None:
+        self.deadline: float | None = deadline
+        self.waiters: int = 0
+
+    def join(self, deadline: float | None, /) -> None:
+        # Retries keep going for as long as any caller is still waiting on the result.
+        if self.deadline is not None:
+            self.deadline = None if deadline is None else max(self.deadline, deadline)
 
 
 class Route:
@@ -120,138 +253,451 @@ class Route:
 
     API_BASE: ClassVar[str] = "https://mystb.in/api"
 
-    def __init__(self, verb: SupportedHTTPVerb, path: str, **params: Any) -> None:
+    def __init__(self, verb: SupportedHTTPVerb, path: str, /, *, api_base: str = API_BASE, **params: Any) -> None:
         self.verb: SupportedHTTPVerb = verb
         self.path: str = path
-        url = self.API_BASE + path
+        url = api_base + path
         if params:
             url = url.format_map({k: _uriquote(v) if isinstance(v, str) else v for k, v in params.items()})
         self.url: str = url
 
 
 class HTTPClient:
+    api_base: str
     root_url: str
 
     __slots__ = (
-        "_locks",
+        "_decoders",
+        "_inflight",
         "_owns_session",
+        "_ratelimiters",
         "_session",
         "_token",
+        "api_base",
+        "cache",
+        "circuit_breaker",
+        "compression",
+        "compression_threshold",
+        "connect_timeout",
+        "executor",
+        "hooks",
+        "json_dumps",
+        "json_loads",
+        "keepalive_timeout",
+        "limit_per_host",
+        "metrics",
+        "offload_threshold",
+        "read_timeout",
+        "retry_policy",
         "root_url",
+        "spread_requests",
+        "ttl_dns_cache",
         "user_agent",
     )
 
-    def __init__(self, *, session: aiohttp.ClientSession | None = None, root_url: str | None = None) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        session: aiohttp.ClientSession | None = None,
+        root_url: str | None = None,
+        spread_requests: bool = False,
+        cache: PasteCache | None = None,
+        json_loads: JSONLoads | None = None,
+        json_dumps: JSONDumps | None = None,
+        executor: Executor | None = None,
+        offload_threshold: int | None = None,
+        compression: str | None = None,
+        compression_threshold: int = 1024,
+        typed_decoding: bool = False,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: int | None = 10,
+        connect_timeout: float | None = 30.0,
+        read_timeout: float | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hooks: TraceHooks | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        if compression is not None and compression not in COMPRESSORS:
+            msg = f"Unsupported compression {compression!r}, available: {', '.join(COMPRESSORS)}."
+            raise ValueError(msg)
+
         self._session: aiohttp.ClientSession | None = session
         self._owns_session: bool = False
-        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        self._ratelimiters: dict[str, RateLimiter] = {}
+        self._inflight: dict[tuple[str, tuple[tuple[str, Any], ...]], SharedRequest] = {}
+        self.spread_requests: bool = spread_requests
+        self.cache: PasteCache | None = cache
+        self.json_loads: JSONLoads = json_loads or from_json
+        self.json_dumps: JSONDumps = json_dumps or to_json
+        self.executor: Executor | None = executor
+        self.offload_threshold: int | None = offload_threshold
+        self.compression: str | None = compression
+        self.compression_threshold: int = compression_threshold
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.ttl_dns_cache: int | None = ttl_dns_cache
+        self.connect_timeout: float | None = connect_timeout
+        self.read_timeout: float | None = read_timeout
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.circuit_breaker: CircuitBreaker | None = circuit_breaker
+        self.hooks: TraceHooks | None = hooks
+        self.metrics: MetricsRegistry | None = metrics
+        self._decoders: dict[str, JSONLoads] = {}
+        if typed_decoding:
+            if msgspec is None:
+                LOGGER.warning("Typed decoding requires msgspec, decoding responses as dicts instead.")
+            else:
+                self._decoders = {
+                    schema: functools.partial(decode_typed, schema, self.json_loads)
+                    for schema in ("file", "create_paste", "get_paste")
+                }
         user_agent = "mystbin.py (https://github.com/PythonistaGuild/mystbin.py {0}) Python/{1[0]}.{1[1]} aiohttp/{2}"
         self.user_agent: str = user_agent.format(__version__, sys.version_info, aiohttp.__version__)
         self._resolve_api(root_url)
 
     def _resolve_api(self, root_url: str | None, /) -> None:
         if root_url:
-            Route.API_BASE = root_url + "api" if root_url.endswith("/") else root_url + "/api"
+            self.api_base = root_url + "api" if root_url.endswith("/") else root_url + "/api"
             self.root_url = root_url + ("/" if not root_url.endswith("/") else "")
         else:
+            self.api_base = Route.API_BASE
             self.root_url = "https://mystb.in/"
 
+    @property
+    def ratelimiters(self) -> Mapping[str, RateLimiter]:
+        return MappingProxyType(self._ratelimiters)
+
+    def get_ratelimiter(self, route: Route, /) -> RateLimiter:
+        limiter = self._ratelimiters.get(route.path)
+        if limiter is None:
+            limiter = self._ratelimiters[route.path] = RateLimiter(spread=self.spread_requests)
+        return limiter
+
+    def loads_for(self, schema: str, /) -> JSONLoads:
+        return self._decoders.get(schema, self.json_loads)
+
     async def close(self) -> None:
         if self._session and self._owns_session:
             await self._session.close()
 
     async def _generate_session(self) -> aiohttp.ClientSession:
-        self._session = aiohttp.ClientSession()
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=self.ttl_dns_cache != 0,
+        )
+        timeout = aiohttp.ClientTimeout(total=5 * 60, sock_connect=self.connect_timeout, sock_read=self.read_timeout)
+        self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
         self._owns_session = True
         return self._session
 
-    async def request(self, route: Route, **kwargs: Any) -> Any:  # noqa: C901, PLR0915
+    async def warm_up(self, connections: int, /) -> None:
+        if self._session is None:
+            self._session = await self._generate_session()
+
+        session = self._session
+
+        async def connect() -> None:
+            # Concurrent requests each need their own connection, which returns to the pool once released.
+            async with session.head(self.root_url, headers={"User-Agent": self.user_agent}):
+                pass
+
+        results = await asyncio.gather(*(connect() for _ in range(connections)), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def request(self, route: Route, *, timeout: float | None = None, **kwargs: Any) -> Any:
+        if timeout is None:
+            return await self._dispatch(route, **kwargs)
+
+        # The timeout covers the whole call, while the deadline stops retries from sleeping past it.
+        deadline = asyncio.get_running_loop().time() + timeout
+        return await asyncio.wait_for(self._dispatch(route, deadline=deadline, **kwargs), timeout)
+
+    async def _dispatch(self, route: Route, *, deadline: float | None = None, **kwargs: Any) -> Any:
+        if route.verb != "GET":
+            return await self._request(route, deadline=deadline, **kwargs)
+
+        # Identical concurrent GETs share a single request and its decoded payload.
+        key = (route.url, tuple(sorted(kwargs.get("params", {}).items())))
+        shared = self._inflight.get(key)
+        if shared is None:
+            shared = self._inflight[key] = SharedRequest(deadline)
+            shared.task = asyncio.ensure_future(self._request(route, shared=shared, **kwargs))
+
+            def _done(_: asyncio.Future[Any], /) -> None:
+                if self._inflight.get(key) is shared:
+                    del self._inflight[key]
+
+            shared.task.add_done_callback(_done)
+        else:
+            LOGGER.debug("Joining in-flight request for: %s", route.url)
+            shared.join(deadline)
+
+        shared.waiters += 1
+        try:
+            # Shielded so a cancelled caller doesn't cancel the request for everyone else.
+            return await asyncio.shield(shared.task)
+        finally:
+            shared.waiters -= 1
+            if not shared.waiters and not shared.task.done():
+                # Nobody is left waiting on the result. Forget it now rather than once the cancellation lands,
+                # so a caller arriving in between starts a new request instead of joining a cancelled one.
+                if self._inflight.get(key) is shared:
+                    del self._inflight[key]
+                shared.task.cancel()
+
+    async def _prepare_body(self, headers: dict[str, str], kwargs: dict[str, Any], /) -> bytes | None:
+        # An estimate of the body size, used to decide whether encoding should leave the event loop.
+        size_hint: int = kwargs.pop("size_hint", 0)
+        if "json" not in kwargs:
+            return None
+
+        headers["Content-Type"] = "application/json"
+        body: bytes = await _run_codec(
+            kwargs.pop("encoder", self.json_dumps),
+            kwargs.pop("json"),
+            phase="Encoded request body of roughly",
+            size=size_hint,
+            threshold=self.offload_threshold,
+            executor=self.executor,
+        )
+        LOGGER.debug("Current json body is: %s", body)
+        kwargs["data"] = body
+
+        compression = self.compression
+        if compression is None or len(body) < self.compression_threshold:
+            return None
+
+        kwargs["data"] = await _run_codec(
+            COMPRESSORS[compression],
+            body,
+            phase=f"Compressed ({compression}) request body of",
+            size=len(body),
+            threshold=self.offload_threshold,
+            executor=self.executor,
+        )
+        headers["Content-Encoding"] = compression
+        LOGGER.debug("Compressed request body from %d to %d bytes", len(body), len(kwargs["data"]))
+        return body
+
+    async def _request(self, route: Route, **kwargs: Any) -> Any:
+        hooks = self.hooks
+        registry = self.metrics
+        if hooks is None and registry is None:
+            return await self._send(route, **kwargs)
+
+        started = time.perf_counter()
+        trace = None if hooks is None else RequestTrace(route, started)
+        metrics = None if registry is None else registry.route(route.verb, route.path)
+        if metrics is not None:
+            metrics.started()
+        if trace is not None:
+            emit(hooks.on_request_start, trace)  # pyright: ignore[reportOptionalMemberAccess]
+        try:
+            return await self._send(route, trace=trace, metrics=metrics, **kwargs)
+        except BaseException as exc:
+            if metrics is not None:
+                metrics.errors += 1
+            if trace is not None:
+                trace.error = exc
+            raise
+        finally:
+            ended = time.perf_counter()
+            if metrics is not None:
+                metrics.finished(ended - started)
+            if trace is not None:
+                trace.ended = ended
+                emit(hooks.on_request_end, trace)  # pyright: ignore[reportOptionalMemberAccess]
+
+    async def _acquire(
+        self,
+        limiter: RateLimiter,
+        trace: RequestTrace | None,
+        metrics: RouteMetrics | None,
+        attempt: int,
+        /,
+    ) -> None:
+        if trace is None and metrics is None:
+            await limiter.acquire()
+            return
+
+        waits = bool(limiter.waiting) or limiter.delay() > 0
+        started = time.perf_counter()
+        await limiter.acquire()
+        if waits:
+            ended = time.perf_counter()
+            if metrics is not None:
+                metrics.ratelimit_wait += ended - started
+            if trace is not None:
+                trace.ratelimit_wait += ended - started
+                emit(self.hooks.on_ratelimit_wait, RatelimitWait(trace, attempt, started, ended))  # pyright: ignore[reportOptionalMemberAccess]
+
+    async def _send(  # noqa: C901, PLR0912, PLR0913, PLR0914, PLR0915
+        self,
+        route: Route,
+        *,
+        stream: bool = False,
+        schema: str | None = None,
+        deadline: float | None = None,
+        shared: SharedRequest | None = None,
+        trace: RequestTrace | None = None,
+        metrics: RouteMetrics | None = None,
+        **kwargs: Any,
+    ) -> Any:
         if self._session is None:
             self._session = await self._generate_session()
 
-        bucket = route.path
-        lock = self._locks.get(bucket)
-        if lock is None:
-            lock = asyncio.Lock()
-            self._locks[bucket] = lock
+        limiter = self.get_ratelimiter(route)
 
         headers = kwargs.pop("headers", {})
         headers["User-Agent"] = self.user_agent
+        headers["Accept-Encoding"] = ACCEPT_ENCODING
 
-        if "json" in kwargs:
-            headers["Content-Type"] = "application/json"
-            kwargs["data"] = json.dumps(kwargs.pop("json"), separators=(",", ":"), ensure_ascii=True)
-            LOGGER.debug("Current json body is: %s", kwargs["data"])
-
+        # Kept so we can fall back if the server rejects the compressed body.
+        uncompressed = await self._prepare_body(headers, kwargs)
         kwargs["headers"] = headers
+        if trace is not None and isinstance(kwargs.get("data"), bytes):
+            trace.bytes_sent = len(kwargs["data"])
 
         LOGGER.debug("Current request headers: %s", headers)
         LOGGER.debug("Current request url: %s", route.url)
 
+        loop = asyncio.get_running_loop()
+
+        def remaining() -> float | None:
+            # The deadline of a shared request moves as callers join it.
+            current = deadline if shared is None else shared.deadline
+            return None if current is None else current - loop.time()
+
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        if policy.budget is not None:
+            policy.budget.deposit()
+
         response: aiohttp.ClientResponse | None = None
-        await lock.acquire()
-        with MaybeUnlock(lock) as maybe_lock:
-            for tries in range(5):
+        for attempt in range(policy.attempts):
+            if breaker is not None:
+                # Fail fast rather than queue behind the ratelimit for an instance that is down.
+                breaker.check()
+
+            await self._acquire(limiter, trace, metrics, attempt)
+            released = False
+            admitted = False
+            healthy: bool | None = None
+            try:
+                if breaker is not None:
+                    breaker.before_request()
+                    admitted = True
+
+                if trace is None:
+                    response = await self._session.request(route.verb, route.url, **kwargs)
+                else:
+                    trace.attempts += 1
+                    sent = time.perf_counter()
+                    response = await self._session.request(route.verb, route.url, **kwargs)
+                    trace.network += time.perf_counter() - sent
+                    trace.status = response.status
+
+                if metrics is not None:
+                    metrics.response(response.status)
+                    if isinstance(kwargs.get("data"), bytes):
+                        metrics.bytes_sent += len(kwargs["data"])
+                if response.status == 429:
+                    # Spend the budget before releasing, so queued requests aren't woken into another 429.
+                    limiter.exhaust(response.headers)
+                limiter.release(response.headers)
+                released = True
+                healthy = response.status < 500
+                handed_off = False
                 try:
-                    async with self._session.request(route.verb, route.url, **kwargs) as response:
-                        # Requests remaining before ratelimit
-                        remaining = response.headers.get("x-ratelimit-remaining", None)
-                        LOGGER.debug("remaining is: %s", remaining)
-                        # Timestamp for when current ratelimit session(?) expires
-                        retry = response.headers.get("x-ratelimit-retry-after", None)
-                        LOGGER.debug("retry is: %s", retry)
-                        if retry is not None:
-                            retry = datetime.datetime.fromtimestamp(int(retry), tz=datetime.timezone.utc)
-                        # The total ratelimit session hits
-                        limit = response.headers.get("x-ratelimit-limit", None)
-                        LOGGER.debug("limit is: %s", limit)
-
-                        if remaining == "0" and response.status != 429:
-                            assert retry is not None
-                            delta = retry - datetime.datetime.now(datetime.timezone.utc)
-                            sleep = delta.total_seconds() + 1
-                            LOGGER.warning("A ratelimit has been exhausted, sleeping for: %d", sleep)
-                            maybe_lock.defer()
-                            loop = asyncio.get_running_loop()
-                            loop.call_later(sleep, lock.release)
-
-                        data = await _json_or_text(response)
-
-                        if 300 > response.status >= 200:
-                            return data
-
-                        if response.status == 429:
-                            assert retry is not None
-                            delta = retry - datetime.datetime.now(datetime.timezone.utc)
-                            sleep = delta.total_seconds() + 1
-                            LOGGER.warning("A ratelimit has been hit, sleeping for: %d", sleep)
-                            await asyncio.sleep(sleep)
-                            continue
-
-                        if response.status in {500, 502, 503, 504}:
-                            sleep_ = 1 + tries * 2
-                            LOGGER.warning("Hit an API error, trying again in: %d", sleep_)
-                            await asyncio.sleep(sleep_)
-                            continue
-
-                        assert isinstance(data, dict)
-                        LOGGER.error("Unhandled HTTP error occurred: %s -> %s", response.status, data)
+                    if stream and 300 > response.status >= 200:
+                        # The caller reads the body and is responsible for releasing the response.
+                        handed_off = True
+                        return response
+
+                    ok = 300 > response.status >= 200
+                    data = await _json_or_text(
+                        response,
+                        # Only successful responses are expected to match the schema.
+                        loads=self.loads_for(schema) if ok and schema else self.json_loads,
+                        offload_threshold=self.offload_threshold,
+                        executor=self.executor,
+                        trace=trace,
+                        metrics=metrics,
+                    )
+
+                    if ok:
+                        return data
+
+                    if not _replayable(kwargs.get("data")):
+                        LOGGER.error("HTTP error occurred and the body cannot be resent: %s -> %s", response.status, data)
                         raise APIException(
                             response=response,
                             status_code=response.status,
                         )
-                except (aiohttp.ServerDisconnectedError, aiohttp.ServerTimeoutError):
-                    LOGGER.exception("Network error occurred:")
-                    await asyncio.sleep(5)
-                    continue
 
-            if response is not None:
-                if response.status >= 500:
-                    raise APIException(response=response, status_code=response.status)
+                    if response.status == 429:
+                        LOGGER.warning("A ratelimit has been hit, sleeping for: %d", limiter.delay())
+                        continue
 
-                raise APIException(response=response, status_code=response.status)
+                    if response.status == 415 and uncompressed is not None:
+                        LOGGER.warning("The server does not accept %s bodies, disabling compression.", self.compression)
+                        self.compression = None
+                        kwargs["data"] = uncompressed
+                        del headers["Content-Encoding"]
+                        uncompressed = None
+                        continue
 
-            raise RuntimeError("Unreachable code in HTTP handling.")
+                    backoff = policy.backoff(attempt, status=response.status, remaining=remaining(), verb=route.verb)
+                    if backoff is None:
+                        LOGGER.error("Unhandled HTTP error occurred: %s -> %s", response.status, data)
+                        raise APIException(
+                            response=response,
+                            status_code=response.status,
+                        )
+
+                    LOGGER.warning("Hit an API error (%d), trying again in: %.2f", response.status, backoff)
+                    if trace is not None:
+                        event = RetryEvent(trace, attempt, backoff, response.status, None, time.perf_counter())
+                        emit(self.hooks.on_retry, event)  # pyright: ignore[reportOptionalMemberAccess]
+                finally:
+                    if not handed_off:
+                        response.release()
+            except policy.retryable_exceptions as exc:
+                healthy = False
+                backoff = policy.backoff(attempt, exception=exc, remaining=remaining(), verb=route.verb)
+                if backoff is None or not _replayable(kwargs.get("data")):
+                    raise
+
+                LOGGER.warning("Network error occurred (%r), trying again in: %.2f", exc, backoff)
+                if trace is not None:
+                    event = RetryEvent(trace, attempt, backoff, None, exc, time.perf_counter())
+                    emit(self.hooks.on_retry, event)  # pyright: ignore[reportOptionalMemberAccess]
+            finally:
+                if not released:
+                    limiter.release()
+                if admitted:
+                    breaker.record(healthy)  # pyright: ignore[reportOptionalMemberAccess]
+
+            if breaker is not None:
+                breaker.check()
+
+            if metrics is not None:
+                metrics.retries += 1
+            if trace is not None:
+                trace.backoff += backoff
+            await asyncio.sleep(backoff)
+
+        # Every attempt was ratelimited.
+        if response is not None:
+            raise APIException(response=response, status_code=response.status)
+
+        raise RuntimeError("Unreachable code in HTTP handling.")
 
     def create_paste(
         self,
@@ -259,26 +705,50 @@ class HTTPClient:
         files: Sequence[File],
         password: str | None,
         expires: datetime.datetime | None,
+        timeout: float | None = None,
     ) -> Response[CreatePasteResponse]:
-        route = Route("POST", "/paste")
-
-        json_: dict[str, Any] = {}
-        json_["files"] = [f.to_dict() for f in files]
+        route = Route("POST", "/paste", api_base=self.api_base)
 
+        extra: dict[str, Any] = {}
         if password:
-            json_["password"] = password
+            extra["password"] = password
         if expires:
-            json_["expires"] = _clean_dt(expires)
-
-        return self.request(route=route, json=json_)
-
-    def delete_paste(self, security_token: str, /) -> Response[bool]:
-        route = Route("GET", "/security/delete/{security_token}", security_token=security_token)
-        return self.request(route)
+            extra["expires"] = _clean_dt(expires)
+
+        if any(f.streamed for f in files):
+            body = StreamedPasteBody(files, extra, dumps=self.json_dumps)
+            return self.request(
+                route=route,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                schema="create_paste",
+                timeout=timeout,
+            )
+
+        return self.request(
+            route=route,
+            json=(files, extra),
+            encoder=functools.partial(_encode_paste, dumps=self.json_dumps),
+            size_hint=sum(len(f.content) for f in files),
+            schema="create_paste",
+            timeout=timeout,
+        )
+
+    def delete_paste(self, security_token: str, /, *, timeout: float | None = None) -> Response[bool]:
+        route = Route("GET", "/security/delete/{security_token}", api_base=self.api_base, security_token=security_token)
+        return self.request(route, timeout=timeout)
+
+    def stream_paste(self, *, paste_id: str, password: str | None) -> Response[aiohttp.ClientResponse]:
+        route = Route("GET", "/paste/{paste_id}", api_base=self.api_base, paste_id=paste_id)
+
+        # Streams are read incrementally by a single caller, so they never share an in-flight request.
+        if password:
+            return self._request(route=route, stream=True, params={"password": password})
+        return self._request(route=route, stream=True)
 
-    def get_paste(self, *, paste_id: str, password: str | None) -> Response[GetPasteResponse]:
-        route = Route("GET", "/paste/{paste_id}", paste_id=paste_id)
+    def get_paste(self, *, paste_id: str, password: str | None, timeout: float | None = None) -> Response[GetPasteResponse]:
+        route = Route("GET", "/paste/{paste_id}", api_base=self.api_base, paste_id=paste_id)
 
         if password:
-            return self.request(route=route, params={"password": password})
-        return self.request(route=route)
+            return self.request(route=route, params={"password": password}, schema="get_paste", timeout=timeout)
+        return self.request(route=route, schema="get_paste", timeout=timeout)
@@ -0,0 +1,316 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import TYPE_CHECKING, Iterable, Mapping, NamedTuple, Tuple
+
+if TYPE_CHECKING:
+    from .http import SupportedHTTPVerb
+
+    SeriesKey = Tuple[str, str]
+
+
+__all__ = (
+    "MetricsRegistry",
+    "RouteStats",
+)
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class RouteStats(NamedTuple):
+    """A snapshot of the metrics recorded for a single route.
+
+    Attributes
+    ----------
+    method: :class:`str`
+        The HTTP method of the route.
+    path: :class:`str`
+        The route template, e.g. ``/paste/{paste_id}``.
+    requests: :class:`int`
+        The amount of requests made, each counted once however many attempts it took.
+    in_flight: :class:`int`
+        The amount of requests currently in progress.
+    errors: :class:`int`
+        The amount of requests that raised instead of returning.
+    retries: :class:`int`
+        The amount of attempts that were retried after an error status or network error.
+    ratelimited: :class:`int`
+        The amount of ``429`` responses received.
+    responses: Mapping[:class:`int`, :class:`int`]
+        The amount of responses received per status code, across all attempts.
+    bytes_sent: :class:`int`
+        The size of the request bodies sent, across all attempts that got a response. Streamed bodies are not counted.
+    bytes_received: :class:`int`
+        The size of the response bodies read. Streamed responses are not counted.
+    ratelimit_wait: :class:`float`
+        Time spent waiting on the ratelimit, in seconds.
+    duration_sum: :class:`float`
+        The total duration of the finished requests, in seconds.
+    duration_count: :class:`int`
+        The amount of finished requests.
+    duration_buckets: Tuple[Tuple[:class:`float`, :class:`int`], ...]
+        Pairs of an upper bound in seconds and the amount of finished requests that took at most that long.
+        The last bound is ``inf``.
+    """
+
+    method: str
+    path: str
+    requests: int
+    in_flight: int
+    errors: int
+    retries: int
+    ratelimited: int
+    responses: Mapping[int, int]
+    bytes_sent: int
+    bytes_received: int
+    ratelimit_wait: float
+    duration_sum: float
+    duration_count: int
+    duration_buckets: tuple[tuple[float, int], ...]
+
+
+class RouteMetrics:
+    """The live counters of a single route, updated in place by the HTTP client."""
+
+    __slots__ = (
+        "_bounds",
+        "buckets",
+        "bytes_received",
+        "bytes_sent",
+        "duration_sum",
+        "errors",
+        "in_flight",
+        "method",
+        "path",
+        "ratelimit_wait",
+        "ratelimited",
+        "requests",
+        "responses",
+        "retries",
+    )
+
+    def __init__(self, method: str, path: str, bounds: tuple[float, ...], /) -> None:
+        self.method: str = method
+        self.path: str = path
+        self._bounds: tuple[float, ...] = bounds
+        self.requests: int = 0
+        self.in_flight: int = 0
+        self.errors: int = 0
+        self.retries: int = 0
+        self.ratelimited: int = 0
+        self.responses: dict[int, int] = {}
+        self.bytes_sent: int = 0
+        self.bytes_received: int = 0
+        self.ratelimit_wait: float = 0.0
+        self.duration_sum: float = 0.0
+        # Per bucket counts, the last one being ``+Inf``. Made cumulative when snapshotted.
+        self.buckets: list[int] = [0] * (len(bounds) + 1)
+
+    def started(self) -> None:
+        self.requests += 1
+        self.in_flight += 1
+
+    def finished(self, duration: float, /) -> None:
+        self.in_flight -= 1
+        self.duration_sum += duration
+        self.buckets[bisect.bisect_left(self._bounds, duration)] += 1
+
+    def response(self, status: int, /) -> None:
+        responses = self.responses
+        responses[status] = responses.get(status, 0) + 1
+        if status == 429:
+            self.ratelimited += 1
+
+    def snapshot(self) -> RouteStats:
+        cumulative: list[tuple[float, int]] = []
+        total = 0
+        for bound, count in zip((*self._bounds, float("inf")), self.buckets):
+            total += count
+            cumulative.append((bound, total))
+
+        return RouteStats(
+            method=self.method,
+            path=self.path,
+            requests=self.requests,
+            in_flight=self.in_flight,
+            errors=self.errors,
+            retries=self.retries,
+            ratelimited=self.ratelimited,
+            responses=dict(self.responses),
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            ratelimit_wait=self.ratelimit_wait,
+            duration_sum=self.duration_sum,
+            duration_count=total,
+            duration_buckets=tuple(cumulative),
+        )
+
+
+def _escape(value: str, /) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float, /) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """An in-process registry of per route request metrics.
+
+    Pass one to :class:`~mystbin.Client` to have its requests counted. A registry can be shared between clients,
+    in which case their requests are aggregated per route.
+
+    Counters are plain attributes updated in place on the event loop, so recording a request takes no locks
+    and, once a route has been seen, creates no new objects. Read them with :meth:`snapshot`
+    or :meth:`to_prometheus`.
+
+    Parameters
+    ----------
+    buckets: Iterable[:class:`float`]
+        The upper bounds, in seconds, of the request duration histogram buckets.
+        Defaults to bounds between 5 milliseconds and 60 seconds.
+
+    Raises
+    ------
+    ValueError
+        ``buckets`` is empty or not strictly increasing.
+    """
+
+    __slots__ = (
+        "_bounds",
+        "_routes",
+    )
+
+    def __init__(self, *, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        bounds = tuple(float(bound) for bound in buckets)
+        if not bounds or any(low >= high for low, high in zip(bounds, bounds[1:])):
+            msg = "buckets must be a non-empty, strictly increasing sequence."
+            raise ValueError(msg)
+
+        self._bounds: tuple[float, ...] = bounds
+        self._routes: dict[SeriesKey, RouteMetrics] = {}
+
+    def __repr__(self) -> str:
+        return f"<MetricsRegistry routes={len(self._routes)}>"
+
+    @property
+    def buckets(self) -> tuple[float, ...]:
+        """The upper bounds, in seconds, of the request duration histogram buckets.
+
+        Returns
+        -------
+        Tuple[:class:`float`, ...]
+        """
+        return self._bounds
+
+    def route(self, method: SupportedHTTPVerb, path: str, /) -> RouteMetrics:
+        """Retrieve the live counters of a route, creating them on first use.
+
+        Returns
+        -------
+        :class:`RouteMetrics`
+        """
+        key = (method, path)
+        metrics = self._routes.get(key)
+        if metrics is None:
+            metrics = self._routes[key] = RouteMetrics(method, path, self._bounds)
+        return metrics
+
+    def snapshot(self) -> tuple[RouteStats, ...]:
+        """A snapshot of the metrics recorded so far, one entry per route.
+
+        Returns
+        -------
+        Tuple[:class:`~mystbin.RouteStats`, ...]
+        """
+        return tuple(metrics.snapshot() for metrics in self._routes.values())
+
+    def reset(self) -> None:
+        """Forget all recorded metrics.
+
+        Requests still in flight are not counted once they finish.
+        """
+        self._routes.clear()
+
+    def to_prometheus(self, *, prefix: str = "mystbin") -> str:
+        """Render the recorded metrics in the Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix: :class:`str`
+            The prefix of every metric name. Defaults to ``mystbin``.
+
+        Returns
+        -------
+        :class:`str`
+            The metrics, ready to be served from a ``/metrics`` endpoint.
+        """
+        stats = self.snapshot()
+        lines: list[str] = []
+
+        def family(name: str, kind: str, description: str) -> str:
+            name = f"{prefix}_{name}"
+            lines.extend((f"# HELP {name} {description}", f"# TYPE {name} {kind}"))
+            return name
+
+        def labels(route: RouteStats, **extra: str) -> str:
+            pairs = {"method": route.method, "route": route.path, **extra}
+            return ",".join(f'{key}="{_escape(value)}"' for key, value in pairs.items())
+
+        simple = (
+            ("requests_total", "counter", "Requests made, however many attempts they took.", "requests"),
+            ("requests_in_flight", "gauge", "Requests currently in progress.", "in_flight"),
+            ("request_errors_total", "counter", "Requests that raised instead of returning.", "errors"),
+            ("retries_total", "counter", "Attempts retried after an error status or network error.", "retries"),
+            ("ratelimited_total", "counter", "429 responses received.", "ratelimited"),
+            ("sent_bytes_total", "counter", "Request body bytes sent.", "bytes_sent"),
+            ("received_bytes_total", "counter", "Response body bytes read.", "bytes_received"),
+            ("ratelimit_wait_seconds_total", "counter", "Time spent waiting on the ratelimit.", "ratelimit_wait"),
+        )
+        for suffix, kind, description, field in simple:
+            name = family(suffix, kind, description)
+            lines.extend(f"{name}{{{labels(route)}}} {_number(getattr(route, field))}" for route in stats)
+
+        name = family("responses_total", "counter", "Responses received, across all attempts.")
+        for route in stats:
+            lines.extend(
+                f"{name}{{{labels(route, status=str(status))}}} {count}" for status, count in sorted(route.responses.items())
+            )
+
+        name = family("request_duration_seconds", "histogram", "How long requests took, including retries.")
+        for route in stats:
+            lines.extend(
+                f"{name}_bucket{{{labels(route, le=_number(bound))}}} {count}" for bound, count in route.duration_buckets
+            )
+            lines.extend(
+                (
+                    f"{name}_sum{{{labels(route)}}} {_number(route.duration_sum)}",
+                    f"{name}_count{{{labels(route)}}} {route.duration_count}",
+                )
+            )
+
+        return "\n".join(lines) + "\n"
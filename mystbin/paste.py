@@ -22,16 +22,24 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import codecs
 import datetime
-from typing import TYPE_CHECKING, Any
+import io
+import mmap
+import pathlib
+from typing import TYPE_CHECKING, Any, BinaryIO, Sequence, TextIO, cast, overload
+
+from .utils import to_json
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    import os
+    from collections.abc import Iterator
 
     from typing_extensions import Self
 
     from .http import HTTPClient
     from .types_.responses import CreatePasteResponse, FileResponse, GetPasteResponse
+    from .utils import JSONDumps
 
 
 __all__ = (
@@ -39,16 +47,19 @@ __all__ = (
     "Paste",
 )
 
+_CHUNK_SIZE = 1 << 16
+
 
 class File:
     """Represents a single file within a mystb.in paste.
 
-    Attributes
-    ----------
-    filename: :class:`str`
-        The file's name.
-    content: :class:`str`
-        The file's contents.
+    Files can also be created lazily from disk or a file object with :meth:`from_path` and :meth:`from_fileobj`,
+    in which case their content is streamed when uploaded rather than held in memory.
+
+    Pass ``cache_encoding=True`` when uploading the same in-memory File to several pastes, so its encoded
+    JSON is kept after the first upload and it is only encoded once. This holds a second, encoded copy of
+    the content for as long as the File lives, so it is off by default. The cache is cleared when
+    :attr:`content` or :attr:`filename` are changed.
     """
 
     _lines_of_code: int
@@ -58,16 +69,197 @@ class File:
 
     __slots__ = (
         "_annotation",
+        "_cache_encoding",
         "_character_count",
+        "_consumed",
+        "_content",
+        "_encoding",
+        "_filename",
+        "_fragment",
         "_lines_of_code",
         "_parent_id",
-        "content",
-        "filename",
+        "_source",
+        "_start",
     )
 
-    def __init__(self, *, filename: str, content: str) -> None:
-        self.filename: str = filename
-        self.content: str = content
+    def __init__(self, *, filename: str, content: str, cache_encoding: bool = False) -> None:
+        self._filename: str = filename
+        self._content: str | None = content
+        self._cache_encoding: bool = cache_encoding
+        self._fragment: tuple[JSONDumps, bytes] | None = None
+        self._source: pathlib.Path | BinaryIO | TextIO | None = None
+        self._encoding: str = "utf-8"
+        self._start: int | None = None
+        self._consumed: bool = False
+
+    @classmethod
+    def from_path(cls, path: str | os.PathLike[str], /, *, filename: str | None = None, encoding: str = "utf-8") -> Self:
+        """Create a File whose content is read from disk when needed.
+
+        The file is memory mapped where possible and streamed in chunks when uploaded.
+
+        Parameters
+        ----------
+        path: Union[:class:`str`, :class:`os.PathLike`]
+            The path of the file on disk.
+        filename: Optional[:class:`str`]
+            The file's name. Defaults to the name of ``path``.
+        encoding: :class:`str`
+            The text encoding of the file. Defaults to ``"utf-8"``.
+
+        Returns
+        -------
+        :class:`~mystbin.File`
+        """
+        path = pathlib.Path(path)
+        self = cls(filename=filename or path.name, content="")
+        self._content = None
+        self._source = path
+        self._encoding = encoding
+        return self
+
+    @classmethod
+    def from_fileobj(cls, fp: BinaryIO | TextIO, /, *, filename: str, encoding: str = "utf-8") -> Self:
+        """Create a File whose content is read from a file object when needed.
+
+        Seekable file objects are read from their current position each time the content is needed,
+        other file objects can only be read once, so uploads of them are not retried.
+
+        Parameters
+        ----------
+        fp: Union[:class:`typing.BinaryIO`, :class:`typing.TextIO`]
+            The binary or text file object to read from.
+        filename: :class:`str`
+            The file's name.
+        encoding: :class:`str`
+            The text encoding of binary file objects. Defaults to ``"utf-8"``.
+
+        Returns
+        -------
+        :class:`~mystbin.File`
+        """
+        self = cls(filename=filename, content="")
+        self._content = None
+        self._source = fp
+        self._encoding = encoding
+        self._start = fp.tell() if fp.seekable() else None
+        return self
+
+    @property
+    def filename(self) -> str:
+        """The file's name.
+
+        Returns
+        -------
+        :class:`str`
+        """
+        return self._filename
+
+    @filename.setter
+    def filename(self, value: str) -> None:
+        self._filename = value
+        self._fragment = None
+
+    @property
+    def content(self) -> str:
+        """The file's contents.
+
+        For files created with :meth:`from_path` or :meth:`from_fileobj` this reads the whole file on every access,
+        prefer :meth:`iter_content` for large files.
+
+        Returns
+        -------
+        :class:`str`
+        """
+        if self._content is None:
+            return "".join(self.iter_content())
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+        self._source = None
+        self._fragment = None
+
+    @property
+    def streamed(self) -> bool:
+        """Whether this file's content is read lazily from a path or file object.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        return self._source is not None
+
+    @property
+    def replayable(self) -> bool:
+        """Whether this file's content can still be read, and so uploaded again.
+
+        This is only ``False`` for files created with :meth:`from_fileobj` from a non-seekable
+        file object that has already been read.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        return not self._consumed
+
+    def iter_content(self, chunk_size: int = _CHUNK_SIZE) -> Iterator[str]:
+        """Iterate over the file's contents in chunks, without reading it all into memory.
+
+        Parameters
+        ----------
+        chunk_size: :class:`int`
+            Roughly how many bytes (or characters, for text file objects) to read at a time.
+            Defaults to 64KiB.
+
+        Yields
+        ------
+        :class:`str`
+            The next chunk of content.
+
+        Raises
+        ------
+        ValueError
+            The file was created from a non-seekable file object that has already been read.
+        """
+        source = self._source
+        if source is None:
+            content = self.content
+            for start in range(0, len(content), chunk_size):
+                yield content[start : start + chunk_size]
+            return
+
+        if isinstance(source, pathlib.Path):
+            with source.open("rb") as fp:
+                yield from self._decode_chunks(_read_mapped(fp, chunk_size))
+            return
+
+        if self._start is not None:
+            source.seek(self._start)
+        elif self._consumed:
+            msg = f"The content of {self._filename!r} was read from a non-seekable file object and cannot be read again."
+            raise ValueError(msg)
+        else:
+            self._consumed = True
+
+        if isinstance(source, io.TextIOBase):
+            text = cast("TextIO", source)
+            yield from iter(lambda: text.read(chunk_size), "")
+        else:
+            binary = cast("BinaryIO", source)
+            yield from self._decode_chunks(iter(lambda: binary.read(chunk_size), b""))
+
+    def _decode_chunks(self, chunks: Iterator[bytes], /) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder(self._encoding)()
+        for chunk in chunks:
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
 
     @property
     def lines_of_code(self) -> int:
@@ -137,6 +329,45 @@ class File:
         """
         return {"content": self.content, "filename": self.filename}
 
+    def to_json(self, dumps: JSONDumps = to_json, /) -> bytes:
+        """Method to dump the File data to an encoded api payload.
+
+        The result is cached for in-memory files created with ``cache_encoding=True``,
+        until :attr:`content` or :attr:`filename` change.
+
+        Parameters
+        ----------
+        dumps: Callable[[Any], :class:`bytes`]
+            The function used to encode the payload.
+            Defaults to ``orjson`` or ``msgspec`` when installed, and :func:`json.dumps` otherwise.
+
+        Returns
+        -------
+        :class:`bytes`
+        """
+        fragment = self._fragment
+        if fragment is not None and fragment[0] is dumps:
+            return fragment[1]
+
+        encoded = dumps(self.to_dict())
+        # Streamed content may change underneath us, so only in-memory content is cached.
+        if self._cache_encoding and self._source is None:
+            self._fragment = (dumps, encoded)
+        return encoded
+
+
+def _read_mapped(fp: BinaryIO, chunk_size: int, /) -> Iterator[bytes]:
+    try:
+        mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Empty files and special files can't be mapped.
+        yield from iter(lambda: fp.read(chunk_size), b"")
+        return
+
+    with mapped:
+        for start in range(0, len(mapped), chunk_size):
+            yield mapped[start : start + chunk_size]
+
 
 class Paste:
     """Represents a Paste object from mystbin instances.
@@ -145,38 +376,65 @@ class Paste:
     ----------
     id: :class:`str`
         The ID of this paste.
-    created_at: :class:`datetime.datetime`
-        When this paste was created in UTC.
-    files: List[:class:`mystbin.File`]
-        The list of files within this Paste.
     """
 
-    _expires: datetime.datetime | None
+    _expires: datetime.datetime | str | None
     _views: int | None
     _security: str | None
 
     __slots__ = (
+        "_created_at",
         "_expires",
+        "_files",
         "_http",
         "_security",
         "_views",
         "author_id",
-        "created_at",
-        "files",
         "id",
     )
 
     def __init__(self, *, http: HTTPClient, paste_id: str, created_at: str, files: Sequence[File]) -> None:
         self._http: HTTPClient = http
         self.id: str = paste_id
-        self.created_at: datetime.datetime = datetime.datetime.fromisoformat(created_at)
-        self.files: Sequence[File] = files
+        self._created_at: datetime.datetime | str = datetime.datetime.fromisoformat(created_at)
+        self._files: Sequence[File] = files
 
     def __str__(self) -> str:
         return self.url
 
     def __repr__(self) -> str:
-        return f"<Paste id={self.id!r} files={len(self.files)}>"
+        return f"<Paste id={self.id!r} files={len(self._files)}>"
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        """When this paste was created in UTC.
+
+        Returns
+        -------
+        :class:`datetime.datetime`
+        """
+        created_at = self._created_at
+        if isinstance(created_at, str):
+            created_at = self._created_at = datetime.datetime.fromisoformat(created_at)
+        return created_at
+
+    @created_at.setter
+    def created_at(self, value: datetime.datetime) -> None:
+        self._created_at = value
+
+    @property
+    def files(self) -> Sequence[File]:
+        """The list of files within this Paste.
+
+        Returns
+        -------
+        Sequence[:class:`~mystbin.File`]
+        """
+        return self._files
+
+    @files.setter
+    def files(self, value: Sequence[File]) -> None:
+        self._files = value
 
     @property
     def url(self) -> str:
@@ -196,7 +454,10 @@ class Paste:
         -------
         Optional[:class:`datetime.datetime`]
         """
-        return self._expires
+        expires = self._expires
+        if isinstance(expires, str):
+            expires = self._expires = datetime.datetime.fromisoformat(expires)
+        return expires
 
     @property
     def views(self) -> int | None:
@@ -219,13 +480,31 @@ class Paste:
         return self._security
 
     @classmethod
-    def from_get(cls, payload: GetPasteResponse, /, *, http: HTTPClient) -> Self:
+    def from_get(cls, payload: GetPasteResponse, /, *, http: HTTPClient, lazy: bool = False) -> Self:
         """Method to create a Paste from the api fetch response.
 
+        Parameters
+        ----------
+        lazy: :class:`bool`
+            Whether to keep a view over ``payload`` instead of copying it, parsing timestamps
+            and creating each :class:`~mystbin.File` only when it is first accessed.
+            Defaults to ``False``.
+
         Returns
         -------
         :class:`~mystbin.Paste`
         """
+        if lazy:
+            self = cls.__new__(cls)
+            self._http = http
+            self.id = payload["id"]
+            self._created_at = payload["created_at"]
+            self._files = _LazyFiles(payload["files"])
+            self._views = payload["views"]
+            self._expires = payload["expires"] or None
+            self._security = None
+            return self
+
         files = [File.from_data(data) for data in payload["files"]]
         self = cls(
             http=http,
@@ -285,3 +564,40 @@ class Paste:
             raise ValueError("Cannot delete a Paste with no Security Token set.")
 
         await self._http.delete_paste(self.security_token)
+        if self._http.cache is not None:
+            self._http.cache.invalidate(self.id)
+
+
+class _LazyFiles(Sequence[File]):
+    """A read-only sequence creating each :class:`File` from its payload on first access."""
+
+    __slots__ = ("_data", "_files")
+
+    def __init__(self, data: list[FileResponse], /) -> None:
+        self._data: list[FileResponse] = data
+        self._files: list[File | None] = [None] * len(data)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def character_count(self) -> int:
+        return sum(file["charcount"] for file in self._data)
+
+    @overload
+    def __getitem__(self, index: int, /) -> File: ...
+
+    @overload
+    def __getitem__(self, index: slice, /) -> list[File]: ...
+
+    def __getitem__(self, index: int | slice, /) -> File | list[File]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._data)))]
+
+        file = self._files[index]
+        if file is None:
+            file = self._files[index] = File.from_data(self._data[index])
+        return file
@@ -0,0 +1,388 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import TYPE_CHECKING, Literal
+
+import aiohttp
+
+from .errors import CircuitBreakerOpen
+from .utils import MISSING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+__all__ = (
+    "CircuitBreaker",
+    "RetryBudget",
+    "RetryPolicy",
+)
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+CircuitState = Literal["closed", "open", "half-open"]
+
+DEFAULT_RETRY_STATUSES: Mapping[int, float] = {500: 0.5, 502: 0.5, 503: 1.0, 504: 0.5}
+DEFAULT_RETRY_EXCEPTIONS: Mapping[type[BaseException], float] = {
+    aiohttp.ServerDisconnectedError: 0.5,
+    aiohttp.ServerTimeoutError: 0.5,
+    aiohttp.ClientConnectorError: 1.0,
+    asyncio.TimeoutError: 0.5,
+}
+DEFAULT_IDEMPOTENT_EXCEPTIONS: tuple[type[BaseException], ...] = (asyncio.TimeoutError,)
+IDEMPOTENT_VERBS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryBudget:
+    """A token bucket limiting how many retries may be made across requests.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, with the bucket also refilling
+    at ``per_second`` tokens a second. While the API is failing, retries are limited to roughly ``ratio``
+    of the requests made, rather than multiplying the load on it.
+
+    Parameters
+    ----------
+    ratio: :class:`float`
+        How many retries each request earns. Defaults to ``0.2``.
+    per_second: :class:`float`
+        How many retries are earned each second regardless of traffic. Defaults to ``1.0``.
+    capacity: :class:`float`
+        The maximum amount of retries that can be saved up. Defaults to ``10.0``.
+    """
+
+    __slots__ = (
+        "_tokens",
+        "_updated",
+        "capacity",
+        "per_second",
+        "ratio",
+    )
+
+    def __init__(self, *, ratio: float = 0.2, per_second: float = 1.0, capacity: float = 10.0) -> None:
+        self.ratio: float = ratio
+        self.per_second: float = per_second
+        self.capacity: float = capacity
+        self._tokens: float = capacity
+        self._updated: float = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"<RetryBudget tokens={self.tokens:.2f} capacity={self.capacity}>"
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.per_second)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """How many retries are currently available.
+
+        Returns
+        -------
+        :class:`float`
+        """
+        self._refill()
+        return self._tokens
+
+    def deposit(self) -> None:
+        """Records a request being made."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Takes a retry from the budget, if one is available.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the retry may be made.
+        """
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    """Decides whether and when failed requests are retried.
+
+    Retries back off exponentially from a base delay chosen per status code or exception,
+    capped at ``max_backoff`` and, by default, randomised with full jitter so that clients
+    failing together don't retry together.
+
+    Ratelimited (``429``) responses are not retried by the policy, they wait for the ratelimit
+    to reset instead.
+
+    Parameters
+    ----------
+    attempts: :class:`int`
+        The maximum amount of times a request is sent, including the first. Defaults to ``5``.
+    max_backoff: :class:`float`
+        The longest delay, in seconds, between two attempts. Defaults to ``30.0``.
+    jitter: :class:`bool`
+        Whether to pick each delay at random between zero and its backoff. Defaults to ``True``.
+    statuses: Mapping[:class:`int`, :class:`float`]
+        The response status codes to retry, mapped to the base delay for them in seconds.
+        Defaults to ``500``, ``502`` and ``504`` with ``0.5`` and ``503`` with ``1.0``.
+    exceptions: Mapping[Type[:class:`BaseException`], :class:`float`]
+        The exceptions to retry, mapped to the base delay for them in seconds. The first matching entry is used.
+        Defaults to server disconnects and timeouts with ``0.5``, connection errors with ``1.0``
+        and :exc:`asyncio.TimeoutError` with ``0.5``.
+    idempotent_exceptions: Tuple[Type[:class:`BaseException`], ...]
+        The exceptions only retried for idempotent requests, such as ``GET``. These may be raised after the
+        request reached the API, so retrying a ``POST`` could create the paste twice.
+        Defaults to :exc:`asyncio.TimeoutError`, which includes :exc:`aiohttp.ServerTimeoutError`.
+    budget: Optional[:class:`~mystbin.RetryBudget`]
+        The budget retries are drawn from, which can be shared by several policies.
+        Defaults to a new :class:`~mystbin.RetryBudget`, ``None`` allows unlimited retries.
+    """
+
+    __slots__ = (
+        "attempts",
+        "budget",
+        "exceptions",
+        "idempotent_exceptions",
+        "jitter",
+        "max_backoff",
+        "statuses",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        attempts: int = 5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        statuses: Mapping[int, float] = DEFAULT_RETRY_STATUSES,
+        exceptions: Mapping[type[BaseException], float] = DEFAULT_RETRY_EXCEPTIONS,
+        idempotent_exceptions: tuple[type[BaseException], ...] = DEFAULT_IDEMPOTENT_EXCEPTIONS,
+        budget: RetryBudget | None = MISSING,
+    ) -> None:
+        self.attempts: int = attempts
+        self.max_backoff: float = max_backoff
+        self.jitter: bool = jitter
+        self.statuses: Mapping[int, float] = statuses
+        self.exceptions: Mapping[type[BaseException], float] = exceptions
+        self.idempotent_exceptions: tuple[type[BaseException], ...] = idempotent_exceptions
+        self.budget: RetryBudget | None = RetryBudget() if budget is MISSING else budget
+
+    def __repr__(self) -> str:
+        return f"<RetryPolicy attempts={self.attempts} max_backoff={self.max_backoff} budget={self.budget!r}>"
+
+    @property
+    def retryable_exceptions(self) -> tuple[type[BaseException], ...]:
+        """The exception types this policy may retry.
+
+        Returns
+        -------
+        Tuple[Type[:class:`BaseException`], ...]
+        """
+        return tuple(self.exceptions)
+
+    def backoff(
+        self,
+        attempt: int,
+        /,
+        *,
+        status: int | None = None,
+        exception: BaseException | None = None,
+        remaining: float | None = None,
+        verb: str = "GET",
+    ) -> float | None:
+        """Computes how long to wait before retrying a failed attempt.
+
+        Parameters
+        ----------
+        attempt: :class:`int`
+            The zero based attempt that failed.
+        status: Optional[:class:`int`]
+            The status code of the failed attempt's response, if any.
+        exception: Optional[:class:`BaseException`]
+            The exception the attempt failed with, if any.
+        remaining: Optional[:class:`float`]
+            How many seconds are left before the request's deadline, if it has one.
+        verb: :class:`str`
+            The HTTP method of the request. Defaults to ``"GET"``.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            The delay in seconds, or ``None`` if the request should not be retried.
+        """
+        if attempt + 1 >= self.attempts:
+            return None
+
+        base: float | None = None
+        if status is not None:
+            base = self.statuses.get(status)
+        elif exception is not None:
+            if verb not in IDEMPOTENT_VERBS and isinstance(exception, self.idempotent_exceptions):
+                return None
+            base = next((delay for exc_type, delay in self.exceptions.items() if isinstance(exception, exc_type)), None)
+
+        if base is None:
+            return None
+
+        delay = min(self.max_backoff, base * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)  # noqa: S311 # not used for security
+
+        # Waiting would outlive the caller, so give up now with the current error.
+        if remaining is not None and delay >= remaining:
+            return None
+
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+
+        return delay
+
+
+class CircuitBreaker:
+    """Stops requests from being made to a mystbin instance that keeps failing.
+
+    While ``closed``, requests are made as normal. After ``failure_threshold`` consecutive attempts fail
+    with a ``5xx`` response or a network error the breaker is ``open``, and requests raise
+    :exc:`~mystbin.CircuitBreakerOpen` straight away instead of queueing and retrying. Once ``recovery_timeout``
+    seconds have passed the breaker is ``half-open`` and lets up to ``probes`` requests through:
+    a success closes it again, while a failure reopens it.
+
+    Parameters
+    ----------
+    failure_threshold: :class:`int`
+        How many consecutive failed attempts open the breaker. Defaults to ``5``.
+    recovery_timeout: :class:`float`
+        How long, in seconds, the breaker stays open before probing for recovery. Defaults to ``30.0``.
+    probes: :class:`int`
+        How many requests may probe for recovery at once while half-open. Defaults to ``1``.
+    """
+
+    __slots__ = (
+        "_failures",
+        "_opened_at",
+        "_probing",
+        "_state",
+        "failure_threshold",
+        "probes",
+        "recovery_timeout",
+    )
+
+    def __init__(self, *, failure_threshold: int = 5, recovery_timeout: float = 30.0, probes: int = 1) -> None:
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout: float = recovery_timeout
+        self.probes: int = probes
+        self._state: CircuitState = "closed"
+        self._failures: int = 0
+        self._opened_at: float = 0.0
+        self._probing: int = 0
+
+    def __repr__(self) -> str:
+        return f"<CircuitBreaker state={self.state!r} failures={self._failures}>"
+
+    @property
+    def state(self) -> CircuitState:
+        """The breaker's current state, one of ``"closed"``, ``"open"`` or ``"half-open"``.
+
+        Returns
+        -------
+        :class:`str`
+        """
+        if self._state == "open" and self.retry_after() <= 0:
+            LOGGER.info("Circuit breaker is half-open, probing for recovery.")
+            self._state = "half-open"
+            self._probing = 0
+        return self._state
+
+    def retry_after(self) -> float:
+        """How many seconds until the breaker lets a request through, ``0`` if it would now.
+
+        Returns
+        -------
+        :class:`float`
+        """
+        if self._state != "open":
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def check(self) -> None:
+        """Ensures the breaker is not open, without taking a probe.
+
+        Raises
+        ------
+        CircuitBreakerOpen
+            The breaker is open.
+        """
+        if self.state == "open":
+            raise CircuitBreakerOpen(self.retry_after())
+
+    def before_request(self) -> None:
+        """Admits an attempt, taking a probe if the breaker is half-open.
+
+        Every admitted attempt must be followed by a call to :meth:`record`.
+
+        Raises
+        ------
+        CircuitBreakerOpen
+            The breaker is open, or every probe is in use.
+        """
+        state = self.state
+        if state == "closed":
+            return
+        if state == "half-open" and self._probing < self.probes:
+            self._probing += 1
+            return
+        raise CircuitBreakerOpen(self.retry_after())
+
+    def record(self, success: bool | None, /) -> None:  # noqa: FBT001
+        """Records the outcome of an admitted attempt.
+
+        Parameters
+        ----------
+        success: Optional[:class:`bool`]
+            Whether the instance responded successfully, or ``None`` if the attempt ended
+            without telling either way, e.g. it was cancelled.
+        """
+        if self._state == "half-open":
+            self._probing = max(0, self._probing - 1)
+
+        if success is None:
+            return
+
+        if success:
+            if self._state != "closed":
+                LOGGER.info("Circuit breaker is closed, the instance has recovered.")
+            self._state = "closed"
+            self._failures = 0
+            return
+
+        self._failures += 1
+        if self._state == "half-open" or self._failures >= self.failure_threshold:
+            if self._state != "open":
+                LOGGER.warning("Circuit breaker is open after %d consecutive failures.", self._failures)
+            self._state = "open"
+            self._opened_at = time.monotonic()
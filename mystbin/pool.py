@@ -0,0 +1,365 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import random
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal, Mapping, Sequence, TypeVar, overload
+
+import aiohttp
+
+from .client import Client
+from .errors import APIException, CircuitBreakerOpen
+from .policies import DEFAULT_RETRY_EXCEPTIONS, RetryPolicy
+
+if TYPE_CHECKING:
+    import datetime
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from .paste import File, Paste
+
+    T = TypeVar("T")
+
+
+__all__ = (
+    "ClientPool",
+    "PoolInstance",
+)
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# How strongly each new response time moves an instance's latency estimate.
+_LATENCY_SMOOTHING = 0.3
+
+# Failures where the request never reached the instance, so it is safe to send elsewhere.
+_UNSENT = (CircuitBreakerOpen, aiohttp.ClientConnectorError)
+
+
+def _failover_policy() -> RetryPolicy:
+    # An instance that refuses connections is skipped for the next one rather than retried.
+    exceptions = {exc: delay for exc, delay in DEFAULT_RETRY_EXCEPTIONS.items() if exc is not aiohttp.ClientConnectorError}
+    return RetryPolicy(exceptions=exceptions)
+
+
+class PoolInstance:
+    """A mystbin instance within a :class:`ClientPool`.
+
+    Attributes
+    ----------
+    client: :class:`~mystbin.Client`
+        The client making requests to this instance.
+    weight: :class:`float`
+        The instance's share of requests when using weighted selection.
+    healthy: :class:`bool`
+        Whether the instance's last health check or request succeeded.
+    latency: Optional[:class:`float`]
+        A moving average of the instance's response time in seconds, if it has responded yet.
+    in_flight: :class:`int`
+        How many requests to the instance are in progress.
+    """
+
+    __slots__ = (
+        "client",
+        "healthy",
+        "in_flight",
+        "latency",
+        "weight",
+    )
+
+    def __init__(self, client: Client, weight: float) -> None:
+        self.client: Client = client
+        self.weight: float = weight
+        self.healthy: bool = True
+        self.latency: float | None = None
+        self.in_flight: int = 0
+
+    def __repr__(self) -> str:
+        return f"<PoolInstance root_url={self.root_url!r} healthy={self.healthy} latency={self.latency}>"
+
+    @property
+    def root_url(self) -> str:
+        """The root URL of the instance.
+
+        Returns
+        -------
+        :class:`str`
+        """
+        return self.client.http.root_url
+
+    def observe(self, elapsed: float, /) -> None:
+        """Records how long, in seconds, the instance took to respond to a request."""
+        latency = self.latency
+        self.latency = elapsed if latency is None else latency + _LATENCY_SMOOTHING * (elapsed - latency)
+
+
+class ClientPool:
+    """Spreads requests across several mystbin instances serving the same pastes, such as regional mirrors.
+
+    Each instance gets its own :class:`~mystbin.Client`, so ratelimits, retries and circuit breakers are
+    tracked per instance. Reads fail over to the next instance if one is down, while pastes are created
+    on a single instance and :meth:`delete_paste` is routed back to the instance that created the paste.
+
+    .. code-block:: python3
+
+        async with mystbin.ClientPool({"https://eu.example.com": 2, "https://us.example.com": 1}) as pool:
+            paste = await pool.get_paste("<paste id>")
+
+    Parameters
+    ----------
+    instances: Union[Mapping[:class:`str`, :class:`float`], Sequence[:class:`str`]]
+        The root URLs of the instances, optionally mapped to their weight.
+    strategy: :class:`str`
+        How instances are chosen for each request. ``"latency"`` picks the instance with the lowest
+        average response time given its in-flight requests, ``"weighted"`` picks at random in proportion to weight.
+        Defaults to ``"latency"``.
+    health_check_interval: Optional[:class:`float`]
+        How often, in seconds, to check that each instance is reachable. Instances are also marked unhealthy when
+        a request to them fails, and are only used when no healthy instance is left until a check or request
+        to them succeeds again.
+        Defaults to ``30.0``, ``None`` disables health checks.
+    max_tracked: :class:`int`
+        How many created pastes to remember the instance of for :meth:`delete_paste`.
+        Defaults to ``10_000``.
+    **options: Any
+        Keyword arguments passed to each instance's :class:`~mystbin.Client`, such as ``session`` or ``retry_policy``.
+        Unless a ``retry_policy`` is given, connection errors are not retried so requests fail over straight away.
+    """
+
+    __slots__ = (
+        "_health_task",
+        "_owners",
+        "health_check_interval",
+        "instances",
+        "max_tracked",
+        "strategy",
+    )
+
+    def __init__(
+        self,
+        instances: Mapping[str, float] | Sequence[str],
+        /,
+        *,
+        strategy: Literal["latency", "weighted"] = "latency",
+        health_check_interval: float | None = 30.0,
+        max_tracked: int = 10_000,
+        **options: Any,
+    ) -> None:
+        weights = instances if isinstance(instances, Mapping) else dict.fromkeys(instances, 1.0)
+        if not weights:
+            raise ValueError("A ClientPool needs at least one instance.")
+        if strategy not in {"latency", "weighted"}:
+            msg = f"Unknown strategy {strategy!r}, expected 'latency' or 'weighted'."
+            raise ValueError(msg)
+        if any(weight <= 0 for weight in weights.values()):
+            raise ValueError("Instance weights must be positive.")
+
+        self.instances: list[PoolInstance] = []
+        for root_url, weight in weights.items():
+            client_options: dict[str, Any] = {"retry_policy": _failover_policy(), **options}
+            self.instances.append(PoolInstance(Client(root_url=root_url, **client_options), weight))
+        self.strategy: Literal["latency", "weighted"] = strategy
+        self.health_check_interval: float | None = health_check_interval
+        self.max_tracked: int = max_tracked
+        self._owners: collections.OrderedDict[str, PoolInstance] = collections.OrderedDict()
+        self._health_task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_cls: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """|coro|
+
+        Stops health checking and closes every instance's client.
+        """
+        task, self._health_task = self._health_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await asyncio.gather(*(instance.client.close() for instance in self.instances))
+
+    def _candidates(self) -> list[PoolInstance]:
+        if self._health_task is None and self.health_check_interval is not None:
+            self._health_task = asyncio.ensure_future(self._health_loop(self.health_check_interval))
+
+        healthy = [instance for instance in self.instances if instance.healthy]
+        unhealthy = [instance for instance in self.instances if not instance.healthy]
+        if self.strategy == "weighted":
+            # A weighted random order, so failover also favours heavier instances.
+            healthy.sort(key=lambda instance: random.random() ** (1 / instance.weight), reverse=True)  # noqa: S311
+        else:
+            # Instances that haven't responded yet are tried first to measure them.
+            healthy.sort(key=lambda instance: (instance.latency or 0.0) * (instance.in_flight + 1))
+        return healthy + unhealthy
+
+    async def _call(
+        self,
+        call: Callable[[Client], Awaitable[T]],
+        /,
+        *,
+        failover: tuple[type[BaseException], ...],
+    ) -> tuple[PoolInstance, T]:
+        instances = self._candidates()
+        for index, instance in enumerate(instances):
+            instance.in_flight += 1
+            start = time.perf_counter()
+            try:
+                result = await call(instance.client)
+            except (APIException, CircuitBreakerOpen, aiohttp.ClientError) as exc:
+                if isinstance(exc, APIException) and exc.status_code < 500:
+                    raise
+
+                if instance.healthy:
+                    LOGGER.warning("Marking %s as unhealthy after %r.", instance.root_url, exc)
+                    instance.healthy = False
+                if not isinstance(exc, failover) or index == len(instances) - 1:
+                    raise
+            else:
+                instance.observe(time.perf_counter() - start)
+                if not instance.healthy:
+                    LOGGER.info("%s is now healthy.", instance.root_url)
+                    instance.healthy = True
+                return instance, result
+            finally:
+                instance.in_flight -= 1
+
+        raise RuntimeError("Unreachable code in ClientPool failover.")
+
+    async def _health_loop(self, interval: float, /) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.check_health()
+
+    async def check_health(self) -> None:
+        """|coro|
+
+        Checks that every instance is reachable now, updating :attr:`PoolInstance.healthy`.
+        """
+
+        async def check(instance: PoolInstance) -> None:
+            breaker = instance.client.http.circuit_breaker
+            try:
+                await asyncio.wait_for(instance.client.warm_up(), timeout=self.health_check_interval or 30.0)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                healthy = False
+                LOGGER.debug("Health check for %s failed: %r", instance.root_url, exc)
+            else:
+                healthy = breaker is None or breaker.state != "open"
+
+            if healthy != instance.healthy:
+                LOGGER.info("%s is now %s.", instance.root_url, "healthy" if healthy else "unhealthy")
+            instance.healthy = healthy
+
+        await asyncio.gather(*(check(instance) for instance in self.instances))
+
+    async def create_paste(
+        self,
+        *,
+        files: Sequence[File],
+        password: str | None = None,
+        expires: datetime.datetime | None = None,
+        timeout: float | None = None,
+    ) -> Paste:
+        """|coro|
+
+        Create a paste on one of the instances.
+
+        Requests are only sent to another instance if they never reached the first, so a paste is never created twice.
+        See :meth:`Client.create_paste` for the parameters.
+
+        Returns
+        -------
+        :class:`~mystbin.Paste`
+            The paste that was created.
+        """
+        instance, paste = await self._call(
+            lambda client: client.create_paste(files=files, password=password, expires=expires, timeout=timeout),
+            failover=_UNSENT,
+        )
+
+        if paste.security_token:
+            self._owners[paste.security_token] = instance
+            if len(self._owners) > self.max_tracked:
+                self._owners.popitem(last=False)
+        return paste
+
+    async def delete_paste(self, security_token: str, /, *, timeout: float | None = None) -> None:
+        """|coro|
+
+        Delete a paste from the instance that created it, if it was created through this pool.
+
+        See :meth:`Client.delete_paste` for the parameters.
+        """
+        owner = self._owners.get(security_token)
+        if owner is None:
+            await self._call(lambda client: client.delete_paste(security_token, timeout=timeout), failover=_UNSENT)
+            return
+
+        await owner.client.delete_paste(security_token, timeout=timeout)
+        self._owners.pop(security_token, None)
+
+    @overload
+    async def get_paste(
+        self, paste_id: str, *, password: str | None = ..., raw: Literal[False], timeout: float | None = ...
+    ) -> Paste: ...
+
+    @overload
+    async def get_paste(
+        self, paste_id: str, *, password: str | None = ..., raw: Literal[True], timeout: float | None = ...
+    ) -> list[str]: ...
+
+    @overload
+    async def get_paste(self, paste_id: str, *, password: str | None = ..., timeout: float | None = ...) -> Paste: ...
+
+    async def get_paste(
+        self, paste_id: str, *, password: str | None = None, raw: bool = False, timeout: float | None = None
+    ) -> Paste | list[str]:
+        """|coro|
+
+        Fetch a paste from one of the instances, trying the others if it fails.
+
+        See :meth:`Client.get_paste` for the parameters.
+
+        Returns
+        -------
+        Union[:class:`~mystbin.Paste`, List[:class:`str`]]
+            The paste data returned.
+        """
+
+        async def fetch(client: Client) -> Paste | list[str]:
+            return await client.get_paste(paste_id, password=password, raw=raw, timeout=timeout)  # pyright: ignore[reportCallIssue, reportArgumentType]
+
+        _, result = await self._call(fetch, failover=(APIException, CircuitBreakerOpen, aiohttp.ClientError))
+        return result
@@ -0,0 +1,333 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import datetime
+import logging
+import math
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+__all__ = ("RateLimiter",)
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# How long to back off when the budget is spent but the server did not say when it resets.
+_FALLBACK_WINDOW: float = 1.0
+
+
+class RateLimiter:
+    """Models the ratelimit budget a mystbin instance reports for a route.
+
+    The limiter is fed the ``x-ratelimit-*`` headers of every response and reserves a token
+    for every request before it is sent, so concurrent requests never overdraw the budget.
+    Once the budget is spent, requests are queued until the window resets.
+
+    Parameters
+    ----------
+    spread: :class:`bool`
+        Whether to pace requests evenly across the remainder of the ratelimit window,
+        rather than sending them as soon as a token is available.
+        Defaults to ``False``.
+    burst: :class:`int`
+        When spreading, how many requests may be sent back to back before pacing applies.
+        Defaults to ``1``.
+    """
+
+    __slots__ = (
+        "_in_flight",
+        "_limit",
+        "_probed",
+        "_remaining",
+        "_reset_epoch",
+        "_tat",
+        "_waiters",
+        "_wakeup",
+        "burst",
+        "spread",
+    )
+
+    def __init__(self, *, spread: bool = False, burst: int = 1) -> None:
+        self.spread: bool = spread
+        self.burst: int = burst
+        self._limit: int | None = None
+        self._remaining: int | None = None
+        self._reset_epoch: float | None = None
+        self._in_flight: int = 0
+        self._probed: bool = False
+        self._tat: float = 0.0
+        self._waiters: collections.deque[asyncio.Future[None]] = collections.deque()
+        self._wakeup: asyncio.TimerHandle | None = None
+
+    def __repr__(self) -> str:
+        return f"<RateLimiter tokens={self.tokens} limit={self._limit} waiting={self.waiting}>"
+
+    @property
+    def limit(self) -> int | None:
+        """The total requests allowed per ratelimit window, if known.
+
+        Returns
+        -------
+        Optional[:class:`int`]
+        """
+        return self._limit
+
+    @property
+    def tokens(self) -> int | None:
+        """The requests that can currently be sent without exceeding the budget, if known.
+
+        This accounts for requests that have been sent but not yet answered.
+
+        Returns
+        -------
+        Optional[:class:`int`]
+        """
+        if self._remaining is None:
+            return None
+        return max(self._remaining - self._in_flight, 0)
+
+    @property
+    def reset_at(self) -> datetime.datetime | None:
+        """When the current ratelimit window resets in UTC, if known.
+
+        Returns
+        -------
+        Optional[:class:`datetime.datetime`]
+        """
+        if self._reset_epoch is None:
+            return None
+        return datetime.datetime.fromtimestamp(self._reset_epoch, tz=datetime.timezone.utc)
+
+    @property
+    def waiting(self) -> int:
+        """The amount of requests queued waiting for a token.
+
+        Returns
+        -------
+        :class:`int`
+        """
+        return len(self._waiters)
+
+    @property
+    def in_flight(self) -> int:
+        """The amount of requests sent that have not yet received a response.
+
+        Returns
+        -------
+        :class:`int`
+        """
+        return self._in_flight
+
+    def delay(self) -> float:
+        """How long a request made now would have to wait before being sent, in seconds.
+
+        This is ``math.inf`` while the first request is still waiting to learn the budget.
+
+        Returns
+        -------
+        :class:`float`
+        """
+        if self._waiters and self._wakeup is not None:
+            return max(self._wakeup.when() - asyncio.get_running_loop().time(), 0.0)
+        return self._next_delay(time.time())
+
+    def _refresh(self, now: float, /) -> None:
+        # The window has rolled over, assume the budget has refilled until told otherwise.
+        if self._reset_epoch is not None and now >= self._reset_epoch:
+            self._remaining = self._limit
+            self._reset_epoch = None
+            if self._limit is None:
+                # Nothing to refill to, so send a single request to learn the budget again.
+                self._probed = False
+
+    def _next_delay(self, now: float, /) -> float:
+        self._refresh(now)
+        tokens = self.tokens
+        if tokens is None:
+            # Until a response tells us the budget, only send a single request to learn it.
+            if not self._probed and self._in_flight:
+                return math.inf
+            return 0.0
+
+        if tokens <= 0:
+            if self._reset_epoch is None:
+                # We have spent the budget but don't know when it resets, retry shortly.
+                return _FALLBACK_WINDOW
+            return self._reset_epoch - now
+
+        if self.spread and self._reset_epoch is not None:
+            interval = max(self._reset_epoch - now, 0) / tokens
+            allowed_at = max(self._tat, now) - self.burst * interval
+            if allowed_at > now:
+                return allowed_at - now
+
+        return 0.0
+
+    def _reserve(self, now: float, /) -> float:
+        delay = self._next_delay(now)
+        if delay > 0:
+            return delay
+
+        if self.spread and self._reset_epoch is not None and self.tokens:
+            interval = max(self._reset_epoch - now, 0) / self.tokens
+            self._tat = max(self._tat, now) + interval
+
+        self._in_flight += 1
+        return 0.0
+
+    def _schedule(self, delay: float, /) -> None:
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        if delay == math.inf:
+            # We'll be woken by the next response instead.
+            return
+
+        loop = asyncio.get_running_loop()
+        self._wakeup = loop.call_later(delay, self._wake)
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        while self._waiters:
+            waiter = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+                continue
+
+            delay = self._reserve(time.time())
+            if delay > 0:
+                self._schedule(delay)
+                return
+
+            self._waiters.popleft()
+            waiter.set_result(None)
+
+    async def acquire(self) -> None:
+        """|coro|
+
+        Wait until a request may be sent and reserve a token for it.
+
+        Every call must be paired with a call to :meth:`release`.
+        """
+        if not self._waiters:
+            delay = self._reserve(time.time())
+            if delay <= 0:
+                return
+
+            if delay != math.inf:
+                LOGGER.warning("A ratelimit has been exhausted, sleeping for: %d", delay)
+            self._schedule(delay)
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        if self._wakeup is None:
+            self._wake()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # We were handed a token as we got cancelled, give it to the next in line.
+                self._in_flight -= 1
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+            if self._waiters:
+                self._wake()
+            raise
+
+    def release(self, headers: Mapping[str, str] | None = None, /) -> None:
+        """Return the token reserved by :meth:`acquire`, updating the budget from a response.
+
+        Parameters
+        ----------
+        headers: Optional[Mapping[:class:`str`, :class:`str`]]
+            The response headers, if a response was received.
+        """
+        self._in_flight = max(self._in_flight - 1, 0)
+        if headers is not None:
+            self._probed = True
+            self._update(headers)
+
+        if self._waiters:
+            self._wake()
+
+    def exhaust(self, headers: Mapping[str, str], /) -> None:
+        """Mark the budget as spent following a ``429`` response.
+
+        Parameters
+        ----------
+        headers: Mapping[:class:`str`, :class:`str`]
+            The headers of the ratelimited response.
+        """
+        self._update(headers)
+        self._remaining = 0
+        self._assume_reset()
+
+    def _update(self, headers: Mapping[str, str], /) -> None:
+        # Requests remaining before ratelimit
+        remaining = headers.get("x-ratelimit-remaining")
+        # Timestamp for when current ratelimit window expires
+        retry = headers.get("x-ratelimit-retry-after")
+        # The total ratelimit window hits
+        limit = headers.get("x-ratelimit-limit")
+        LOGGER.debug("remaining is: %s, retry is: %s, limit is: %s", remaining, retry, limit)
+
+        if limit is not None:
+            self._limit = int(limit)
+
+        if retry is not None:
+            # The server reports whole seconds, pad it to be on the safe side.
+            reset = int(retry) + 1
+            if self._reset_epoch is None or reset > self._reset_epoch:
+                # A new window, so the latest report is authoritative.
+                self._reset_epoch = reset
+                self._tat = 0.0
+                if remaining is not None:
+                    self._remaining = int(remaining)
+                return
+
+        if remaining is not None:
+            # Responses can arrive out of order within a window; the lowest report is the most recent.
+            remaining_ = int(remaining)
+            self._remaining = remaining_ if self._remaining is None else min(self._remaining, remaining_)
+            self._assume_reset()
+
+    def _assume_reset(self) -> None:
+        # Proxies and CDNs may ratelimit without saying when the window resets. Without a reset
+        # the budget would never refill, so assume a short window and probe again once it passes.
+        if self._reset_epoch is None and self._remaining is not None and self._remaining <= 0:
+            self._reset_epoch = time.time() + _FALLBACK_WINDOW
@@ -0,0 +1,255 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from typing_extensions import Buffer
+
+__all__ = ("DownloadedFile",)
+
+# Characters that change the scanner's state outside and inside of strings.
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+# The body of a string up to its closing quote, consuming escape sequences along the way.
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+# A member of a flat JSON object, capturing the key and the span of the value.
+_MEMBER = re.compile(
+    rb'"([^"\\]*(?:\\.[^"\\]*)*)"\s*:\s*("[^"\\]*(?:\\.[^"\\]*)*"|[^,}\s]+)',
+    re.DOTALL,
+)
+# A JSON escape sequence, with ``\uXXXX`` surrogate pairs matched together.
+_ESCAPE = re.compile(rb"\\(?:u([0-9a-fA-F]{4})(?:\\u([dD][c-fC-F][0-9a-fA-F]{2}))?|(.))", re.DOTALL)
+_SIMPLE_ESCAPES = {
+    ord('"'): b'"',
+    ord("\\"): b"\\",
+    ord("/"): b"/",
+    ord("b"): b"\b",
+    ord("f"): b"\f",
+    ord("n"): b"\n",
+    ord("r"): b"\r",
+    ord("t"): b"\t",
+}
+
+
+class DownloadedFile(NamedTuple):
+    """The outcome of writing a single file with :meth:`Client.download_paste`.
+
+    Attributes
+    ----------
+    filename: :class:`str`
+        The file's name.
+    path: Optional[:class:`pathlib.Path`]
+        Where the file was written, if it was written to disk.
+    bytes_written: :class:`int`
+        The amount of UTF-8 encoded bytes written.
+    elapsed: :class:`float`
+        How long writing the file took, in seconds.
+    """
+
+    filename: str
+    path: pathlib.Path | None
+    bytes_written: int
+    elapsed: float
+
+
+def object_members(raw: bytes, /) -> dict[bytes, tuple[int, int]]:
+    """Find the members of a flat JSON object without decoding it.
+
+    Returns
+    -------
+    Dict[:class:`bytes`, Tuple[:class:`int`, :class:`int`]]
+        The raw keys mapped to the span of their raw values. String values are spanned without their quotes.
+    """
+    members: dict[bytes, tuple[int, int]] = {}
+    for match in _MEMBER.finditer(raw):
+        start, end = match.span(2)
+        if raw[start] == 0x22:  # quote
+            start, end = start + 1, end - 1
+        members[match.group(1)] = (start, end)
+    return members
+
+
+def _unescape(match: re.Match[bytes], /) -> bytes:
+    simple = match.group(3)
+    if simple is not None:
+        return _SIMPLE_ESCAPES[simple[0]]
+
+    first = int(match.group(1), 16)
+    low = match.group(2)
+    if low is None:
+        return chr(first).encode("utf-8", "surrogatepass")
+    if 0xD800 <= first <= 0xDBFF:
+        return chr(0x10000 + ((first - 0xD800) << 10) + (int(low, 16) - 0xDC00)).encode("utf-8")
+    return chr(first).encode("utf-8", "surrogatepass") + chr(int(low, 16)).encode("utf-8", "surrogatepass")
+
+
+def write_json_string(raw: Buffer, write: Callable[[Any], Any], /) -> int:
+    """Write the UTF-8 value of a raw JSON string body, without decoding it to :class:`str`.
+
+    Runs between escape sequences are written as zero-copy slices of ``raw``.
+
+    Returns
+    -------
+    :class:`int`
+        The amount of bytes written.
+    """
+    view = memoryview(raw)
+    written = 0
+    last = 0
+    for match in _ESCAPE.finditer(view):
+        start, end = match.span()
+        if start > last:
+            write(view[last:start])
+            written += start - last
+
+        unescaped = _unescape(match)
+        write(unescaped)
+        written += len(unescaped)
+        last = end
+
+    if last < len(view):
+        write(view[last:])
+        written += len(view) - last
+
+    return written
+
+
+class FileObjectScanner:
+    """Incrementally finds the file objects in a ``GetPasteResponse`` body as it is received.
+
+    Bytes are fed in as they arrive, and the raw bytes of each object in the top level ``files`` array
+    are returned as soon as the object is complete. Only the object currently being received is buffered.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_depth",
+        "_files_depth",
+        "_in_string",
+        "_last_string",
+        "_object_start",
+        "_pos",
+        "_string_start",
+        "done",
+    )
+
+    def __init__(self) -> None:
+        self._buffer: bytearray = bytearray()
+        self._pos: int = 0
+        self._depth: int = 0
+        self._in_string: bool = False
+        self._string_start: int | None = None
+        # The last complete string at depth 1, i.e. the most recent top level key.
+        self._last_string: bytes = b""
+        self._files_depth: int | None = None
+        self._object_start: int | None = None
+        self.done: bool = False
+
+    def feed(self, data: bytes, /) -> list[bytes]:  # noqa: C901, PLR0912
+        """Feed the next chunk of the body.
+
+        Returns
+        -------
+        List[:class:`bytes`]
+            The raw JSON of each file object completed by this chunk.
+        """
+        if self.done:
+            return []
+
+        buffer = self._buffer
+        buffer += data
+        completed: list[bytes] = []
+        pos = self._pos
+
+        while not self.done:
+            if self._in_string:
+                match = _STRING_BODY.match(buffer, pos)
+                assert match is not None
+                index = match.end()
+                if index >= len(buffer) or buffer[index] != 0x22:  # quote
+                    # The rest of the string, or the character a trailing backslash escapes, hasn't arrived yet.
+                    pos = index
+                    break
+
+                self._in_string = False
+                if self._string_start is not None:
+                    self._last_string = bytes(buffer[self._string_start : index])
+                    self._string_start = None
+                pos = index + 1
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+
+            index = match.start()
+            char = buffer[index]
+            pos = index + 1
+            if char == 0x22:  # quote
+                self._in_string = True
+                if self._depth == 1:
+                    self._string_start = pos
+            elif char in {0x7B, 0x5B}:  # { [
+                if char == 0x5B and self._depth == 1 and self._last_string == b"files":
+                    self._files_depth = self._depth + 1
+                elif char == 0x7B and self._files_depth is not None and self._depth == self._files_depth:
+                    self._object_start = index
+                self._depth += 1
+            else:  # } ]
+                self._depth -= 1
+                if self._object_start is not None and self._depth == self._files_depth:
+                    completed.append(bytes(buffer[self._object_start : pos]))
+                    self._object_start = None
+                elif self._files_depth is not None and self._depth == self._files_depth - 1:
+                    # The files array is closed, nothing else is of interest.
+                    self.done = True
+
+        if self.done:
+            buffer.clear()
+        else:
+            self._compact(pos)
+        return completed
+
+    def _compact(self, pos: int, /) -> None:
+        # Drop everything that is no longer needed.
+        keep = pos
+        if self._object_start is not None:
+            keep = self._object_start
+        elif self._string_start is not None:
+            keep = self._string_start
+
+        if keep:
+            del self._buffer[:keep]
+            pos -= keep
+            if self._object_start is not None:
+                self._object_start -= keep
+            if self._string_start is not None:
+                self._string_start -= keep
+
+        self._pos = pos
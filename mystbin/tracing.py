@@ -0,0 +1,224 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Callable, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from .http import Route
+
+    T = TypeVar("T")
+
+
+__all__ = (
+    "RatelimitWait",
+    "RequestTrace",
+    "RetryEvent",
+    "TraceHooks",
+)
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class RequestTrace:
+    """The timings of a single request, including all of its attempts.
+
+    Passed to :attr:`TraceHooks.on_request_start` before the first attempt and to :attr:`TraceHooks.on_request_end`
+    once the request has finished. Timestamps are from :func:`time.perf_counter` and durations are in seconds.
+
+    Attributes
+    ----------
+    method: :class:`str`
+        The HTTP method of the request.
+    path: :class:`str`
+        The route template of the request, e.g. ``/paste/{paste_id}``.
+    url: :class:`str`
+        The full URL of the request.
+    started: :class:`float`
+        When the request started.
+    ended: Optional[:class:`float`]
+        When the request ended, if it has.
+    attempts: :class:`int`
+        How many attempts have been sent.
+    status: Optional[:class:`int`]
+        The status code of the last response, if any.
+    error: Optional[:class:`BaseException`]
+        The exception the request failed with, if any.
+    bytes_sent: Optional[:class:`int`]
+        The size of the request body, if known. Streamed bodies are not counted.
+    bytes_received: :class:`int`
+        The size of the response bodies read.
+    ratelimit_wait: :class:`float`
+        Time spent waiting on the ratelimit.
+    network: :class:`float`
+        Time spent sending requests and reading responses.
+    decode: :class:`float`
+        Time spent decoding response bodies.
+    backoff: :class:`float`
+        Time spent sleeping between retries.
+    """
+
+    __slots__ = (
+        "attempts",
+        "backoff",
+        "bytes_received",
+        "bytes_sent",
+        "decode",
+        "ended",
+        "error",
+        "method",
+        "network",
+        "path",
+        "ratelimit_wait",
+        "started",
+        "status",
+        "url",
+    )
+
+    def __init__(self, route: Route, started: float) -> None:
+        self.method: str = route.verb
+        self.path: str = route.path
+        self.url: str = route.url
+        self.started: float = started
+        self.ended: float | None = None
+        self.attempts: int = 0
+        self.status: int | None = None
+        self.error: BaseException | None = None
+        self.bytes_sent: int | None = None
+        self.bytes_received: int = 0
+        self.ratelimit_wait: float = 0.0
+        self.network: float = 0.0
+        self.decode: float = 0.0
+        self.backoff: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"<RequestTrace method={self.method!r} path={self.path!r} attempts={self.attempts} status={self.status}>"
+
+    @property
+    def elapsed(self) -> float | None:
+        """The total duration of the request, if it has ended.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+        """
+        return None if self.ended is None else self.ended - self.started
+
+
+class RetryEvent(NamedTuple):
+    """Passed to :attr:`TraceHooks.on_retry` before sleeping ahead of another attempt.
+
+    Attributes
+    ----------
+    trace: :class:`RequestTrace`
+        The request being retried.
+    attempt: :class:`int`
+        The zero based attempt that failed.
+    delay: :class:`float`
+        How long, in seconds, until the next attempt.
+    status: Optional[:class:`int`]
+        The status code of the failed attempt, if it got a response.
+    error: Optional[:class:`BaseException`]
+        The exception the attempt failed with, if any.
+    timestamp: :class:`float`
+        When the attempt failed, from :func:`time.perf_counter`.
+    """
+
+    trace: RequestTrace
+    attempt: int
+    delay: float
+    status: int | None
+    error: BaseException | None
+    timestamp: float
+
+
+class RatelimitWait(NamedTuple):
+    """Passed to :attr:`TraceHooks.on_ratelimit_wait` after an attempt had to wait for the ratelimit.
+
+    Attributes
+    ----------
+    trace: :class:`RequestTrace`
+        The request that waited.
+    attempt: :class:`int`
+        The zero based attempt that waited.
+    started: :class:`float`
+        When the wait started, from :func:`time.perf_counter`.
+    ended: :class:`float`
+        When the wait ended, from :func:`time.perf_counter`.
+    """
+
+    trace: RequestTrace
+    attempt: int
+    started: float
+    ended: float
+
+
+class TraceHooks:
+    """Callbacks notified of each request's phases, to feed metrics or a tracing system.
+
+    Callbacks are called synchronously on the event loop, so they should be quick and must not block.
+    Exceptions raised by a callback are logged and otherwise ignored.
+    When a :class:`~mystbin.Client` has no hooks, requests are not timed at all.
+
+    Parameters
+    ----------
+    on_request_start: Optional[Callable[[:class:`RequestTrace`], None]]
+        Called before a request's first attempt.
+    on_retry: Optional[Callable[[:class:`RetryEvent`], None]]
+        Called when an attempt failed and will be retried.
+    on_ratelimit_wait: Optional[Callable[[:class:`RatelimitWait`], None]]
+        Called after an attempt waited for the ratelimit.
+    on_request_end: Optional[Callable[[:class:`RequestTrace`], None]]
+        Called once a request has succeeded or failed.
+    """
+
+    __slots__ = (
+        "on_ratelimit_wait",
+        "on_request_end",
+        "on_request_start",
+        "on_retry",
+    )
+
+    def __init__(
+        self,
+        *,
+        on_request_start: Callable[[RequestTrace], object] | None = None,
+        on_retry: Callable[[RetryEvent], object] | None = None,
+        on_ratelimit_wait: Callable[[RatelimitWait], object] | None = None,
+        on_request_end: Callable[[RequestTrace], object] | None = None,
+    ) -> None:
+        self.on_request_start: Callable[[RequestTrace], object] | None = on_request_start
+        self.on_retry: Callable[[RetryEvent], object] | None = on_retry
+        self.on_ratelimit_wait: Callable[[RatelimitWait], object] | None = on_ratelimit_wait
+        self.on_request_end: Callable[[RequestTrace], object] | None = on_request_end
+
+
+def emit(callback: Callable[[T], object] | None, event: T, /) -> None:
+    """Calls a hook with an event, if it is set, logging rather than raising its errors."""
+    if callback is None:
+        return
+    try:
+        callback(event)
+    except Exception:
+        LOGGER.exception("Ignoring exception in trace hook %r:", callback)
@@ -0,0 +1,96 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from mystbin.utils import msgspec
+
+if TYPE_CHECKING:
+    from mystbin.utils import JSONLoads
+
+__all__ = ()
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+if msgspec is not None:
+    # These annotations are evaluated at runtime by msgspec, so they must stay valid on Python 3.8.
+
+    class _Payload(msgspec.Struct, gc=False):  # pyright: ignore[reportUntypedBaseClass]
+        # Lets the structs be read like the dicts they stand in for.
+        def __getitem__(self, key: str, /) -> Any:
+            return getattr(self, key)
+
+    class FileStruct(_Payload):
+        annotation: str
+        charcount: int
+        content: str
+        filename: str
+        loc: int
+        parent_id: str
+
+    class CreatePasteStruct(_Payload):
+        created_at: str
+        expires: Optional[str]  # noqa: UP045
+        id: str
+        safety: str
+
+    class GetPasteStruct(_Payload):
+        id: str
+        has_password: bool
+        views: int
+        created_at: str
+        expires: Optional[str]  # noqa: UP045
+        files: List[FileStruct]  # noqa: UP006
+
+    _DECODERS: dict[str, Any] = {
+        "file": msgspec.json.Decoder(FileStruct),  # pyright: ignore[reportUnknownMemberType]
+        "create_paste": msgspec.json.Decoder(CreatePasteStruct),  # pyright: ignore[reportUnknownMemberType]
+        "get_paste": msgspec.json.Decoder(GetPasteStruct),  # pyright: ignore[reportUnknownMemberType]
+    }
+
+
+def decode_typed(schema: str, fallback: JSONLoads, data: bytes, /) -> Any:
+    """Decode and validate a response body into the struct for ``schema`` in a single pass.
+
+    Bodies that don't match the schema are logged and decoded with ``fallback`` instead.
+
+    Returns
+    -------
+    Any
+        The struct, or whatever ``fallback`` returns.
+
+    Raises
+    ------
+    ValueError
+        The body is not valid JSON.
+    """
+    try:
+        return _DECODERS[schema].decode(data)
+    except msgspec.ValidationError as exc:  # pyright: ignore[reportUnknownMemberType]
+        LOGGER.warning("Response does not match the %r schema, decoding it without validation: %s", schema, exc)
+    except msgspec.DecodeError as exc:  # pyright: ignore[reportUnknownMemberType]
+        raise ValueError(str(exc)) from exc
+    return fallback(data)
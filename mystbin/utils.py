@@ -20,9 +20,59 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
-from typing import Any
+from __future__ import annotations
 
-__all__ = ("MISSING",)
+import asyncio
+import json
+import zlib
+from collections.abc import AsyncIterable
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Iterable
+
+try:
+    from aiohttp import compression_utils
+except ImportError:
+    # Added in aiohttp 3.9.
+    compression_utils = None
+
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec  # pyright: ignore[reportMissingImports]
+except ImportError:
+    msgspec = None
+
+try:
+    import brotli  # pyright: ignore[reportMissingImports, reportMissingTypeStubs]
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard  # pyright: ignore[reportMissingImports]
+except ImportError:
+    zstandard = None
+
+__all__ = (
+    "ACCEPT_ENCODING",
+    "COMPRESSORS",
+    "MISSING",
+    "JSONDumps",
+    "JSONLoads",
+    "bounded_map",
+    "from_json",
+    "to_json",
+)
+
+JSONLoads = Callable[[bytes], Any]
+JSONDumps = Callable[[Any], bytes]
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class _MissingSentinel:
@@ -42,3 +92,157 @@ class _MissingSentinel:
 
 
 MISSING: Any = _MissingSentinel()
+
+
+if orjson is not None:
+    from_json: JSONLoads = orjson.loads  # pyright: ignore[reportUnknownMemberType]
+    to_json: JSONDumps = orjson.dumps  # pyright: ignore[reportUnknownMemberType]
+elif msgspec is not None:
+    _decoder = msgspec.json.Decoder()  # pyright: ignore[reportUnknownMemberType]
+    _DecodeError: type[Exception] = msgspec.DecodeError
+    to_json = msgspec.json.Encoder().encode  # pyright: ignore[reportUnknownMemberType]
+
+    def from_json(data: bytes, /) -> Any:  # noqa: D103
+        try:
+            return _decoder.decode(data)  # pyright: ignore[reportUnknownMemberType]
+        except _DecodeError as exc:
+            # Keep the contract of raising ValueError on invalid JSON.
+            raise ValueError(str(exc)) from exc
+
+else:
+    from_json = json.loads
+
+    def to_json(obj: Any, /) -> bytes:  # noqa: D103
+        # Non-ASCII is left as is rather than escaped, which can be up to 6x larger.
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _gzip(data: bytes, /) -> bytes:
+    # Level 6 is zlib's default trade-off; wbits=31 produces a gzip container.
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {"gzip": _gzip}
+"""The request body ``Content-Encoding`` values available, mapped to their compressor."""
+
+if brotli is not None:
+    _brotli_compress: Callable[..., bytes] = brotli.compress  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+    def _brotli(data: bytes, /) -> bytes:
+        # The default quality of 11 is far too slow to sit in front of an upload.
+        return _brotli_compress(data, quality=5)
+
+    COMPRESSORS["br"] = _brotli
+if zstandard is not None:
+    _zstd_compressor: Callable[[], Any] = zstandard.ZstdCompressor  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+    def _zstd(data: bytes, /) -> bytes:
+        # Compressors are not thread safe, and bodies may be compressed in several executor threads at once.
+        return _zstd_compressor().compress(data)
+
+    COMPRESSORS["zstd"] = _zstd
+
+_decodable = ["gzip", "deflate"]
+if compression_utils is None:
+    # aiohttp 3.8 decodes brotli with the brotli package when it is installed, and has no zstd support.
+    if brotli is not None:
+        _decodable.append("br")
+else:
+    if compression_utils.HAS_BROTLI:
+        _decodable.append("br")
+    if getattr(compression_utils, "HAS_ZSTD", False):
+        _decodable.append("zstd")
+
+ACCEPT_ENCODING: str = ", ".join(_decodable)
+"""The response encodings aiohttp is able to decode in this environment."""
+
+
+class _Done:
+    __slots__ = ()
+
+
+_DONE = _Done()
+
+
+async def _aiter(items: Iterable[T], /) -> AsyncIterator[T]:  # noqa: RUF029
+    for item in items:
+        yield item
+
+
+async def bounded_map(  # noqa: C901
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T] | AsyncIterable[T],
+    /,
+    *,
+    concurrency: int,
+) -> AsyncIterator[tuple[T, R | Exception]]:
+    """Run ``func`` over ``items`` with at most ``concurrency`` calls in flight.
+
+    Items are pulled from ``items`` lazily, so memory use is bounded by ``concurrency``
+    regardless of how many items there are.
+
+    Yields
+    ------
+    Tuple[Any, Any]
+        ``(item, result)`` pairs in completion order, with exceptions raised by ``func``
+        in place of a result.
+
+    Raises
+    ------
+    ValueError
+        ``concurrency`` was less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    iterator = (items if isinstance(items, AsyncIterable) else _aiter(items)).__aiter__()
+    # Async generators cannot be advanced concurrently.
+    next_lock = asyncio.Lock()
+    # Held from pulling an item until its result is consumed, bounding in-flight and buffered results.
+    slots = asyncio.Semaphore(concurrency)
+    queue: asyncio.Queue[tuple[T, R | Exception] | _Done | Exception] = asyncio.Queue()
+
+    async def worker() -> None:
+        try:
+            while True:
+                await slots.acquire()
+                async with next_lock:
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        slots.release()
+                        return
+
+                try:
+                    result: R | Exception = await func(item)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # noqa: BLE001 # handed to the consumer
+                    result = exc
+
+                queue.put_nowait((item, result))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001 # re-raised in the consumer
+            queue.put_nowait(exc)
+        finally:
+            queue.put_nowait(_DONE)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    running = len(workers)
+    try:
+        while running:
+            entry = await queue.get()
+            if isinstance(entry, _Done):
+                running -= 1
+                continue
+            if isinstance(entry, Exception):
+                raise entry
+
+            slots.release()
+            yield entry
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,147 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+import mystbin
+from benchmarks.server import Faults, StandIn
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+def _run(test: Callable[[mystbin.Client, StandIn, str], Awaitable[Any]], /) -> None:
+    async def runner() -> None:
+        async with StandIn() as stand_in:
+            url = await stand_in.start()
+            async with mystbin.Client(root_url=url) as client:
+                paste = await client.create_paste(files=[mystbin.File(filename="a.txt", content="a")])
+                await test(client, stand_in, paste.id)
+                _assert_settled(client)
+
+    asyncio.run(runner())
+
+
+def _assert_settled(client: mystbin.Client, /) -> None:
+    for route, limiter in client.ratelimits.items():
+        assert limiter.in_flight == 0, f"{route} still has a request in flight."
+        assert limiter.waiting == 0, f"{route} still has a request queued."
+    assert not client.http._inflight  # noqa: SLF001
+
+
+async def _cancel_soon(coro: Awaitable[Any], /, delay: float = 0.05) -> None:
+    task = asyncio.ensure_future(coro)
+    await asyncio.sleep(delay)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+def test_cancel_in_flight() -> None:
+    """A request cancelled while waiting on the response gives its token back."""
+
+    async def test(client: mystbin.Client, stand_in: StandIn, paste_id: str) -> None:
+        stand_in.faults = Faults(latency=0.5)
+        await _cancel_soon(client.get_paste(paste_id))
+        _assert_settled(client)
+
+        stand_in.faults = Faults()
+        paste = await asyncio.wait_for(client.get_paste(paste_id), 2)
+        assert paste.id == paste_id
+
+    _run(test)
+
+
+def test_cancel_queued_on_ratelimit() -> None:
+    """A request cancelled while queued on an exhausted ratelimit leaves the queue."""
+
+    async def test(client: mystbin.Client, stand_in: StandIn, paste_id: str) -> None:
+        stand_in.limit = 1
+        await client.get_paste(paste_id)
+        await _cancel_soon(client.get_paste(paste_id))
+        _assert_settled(client)
+
+        paste = await asyncio.wait_for(client.get_paste(paste_id), 3)
+        assert paste.id == paste_id
+
+    _run(test)
+
+
+def test_timeout_does_not_stall() -> None:
+    """A request timing out does not hold up the requests after it."""
+
+    async def test(client: mystbin.Client, stand_in: StandIn, paste_id: str) -> None:
+        stand_in.faults = Faults(latency=0.5)
+        with pytest.raises(asyncio.TimeoutError):
+            await client.get_paste(paste_id, timeout=0.05)
+        _assert_settled(client)
+
+        stand_in.faults = Faults()
+        paste = await client.get_paste(paste_id, timeout=2)
+        assert paste.id == paste_id
+
+    _run(test)
+
+
+def test_timeout_bounds_retries() -> None:
+    """A request gives up with the API's error rather than backing off past its timeout."""
+
+    async def test(client: mystbin.Client, stand_in: StandIn, paste_id: str) -> None:
+        client.http.retry_policy = mystbin.RetryPolicy(statuses=dict.fromkeys((500, 502, 503, 504), 2.0), jitter=False)
+        stand_in.faults = Faults(error_rate=1.0, burst_length=1)
+        with pytest.raises(mystbin.APIException):
+            await client.get_paste(paste_id, timeout=1)
+
+        # Shared requests keep retrying for the caller waiting longest.
+        first = asyncio.ensure_future(client.get_paste(paste_id, timeout=1))
+        second = asyncio.ensure_future(client.get_paste(paste_id, timeout=3))
+        with pytest.raises(asyncio.TimeoutError):
+            await first
+        stand_in.faults = Faults()
+        paste = await second
+        assert paste.id == paste_id
+
+    _run(test)
+
+
+def test_cancel_shared_request() -> None:
+    """A caller arriving after every sharer of a request cancelled it starts a new request."""
+
+    async def test(client: mystbin.Client, stand_in: StandIn, paste_id: str) -> None:
+        stand_in.faults = Faults(latency=0.2)
+        first = asyncio.ensure_future(client.get_paste(paste_id))
+        second = asyncio.ensure_future(client.get_paste(paste_id))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        second.cancel()
+        # Without yielding, so the shared request has not finished cancelling yet.
+        paste = await asyncio.wait_for(client.get_paste(paste_id), 2)
+        assert paste.id == paste_id
+        assert first.cancelled()
+        assert second.cancelled()
+
+    _run(test)
@@ -0,0 +1,72 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2020 - Present, PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+
+from aiohttp import web
+
+import mystbin
+
+
+def test_unannounced_ratelimit_holds_queue() -> None:
+    """A ``429`` without ratelimit headers holds back the queued requests until the window is assumed to reset."""
+
+    async def runner() -> None:
+        statuses: collections.Counter[int] = collections.Counter()
+        loop = asyncio.get_running_loop()
+        limited_until = loop.time() + 0.5
+
+        async def get(request: web.Request) -> web.Response:  # noqa: RUF029
+            # Ratelimited for a while, as by a proxy that doesn't send ratelimit headers.
+            status = 429 if loop.time() < limited_until else 200
+            statuses[status] += 1
+            if status == 429:
+                return web.json_response({"error": "You are being ratelimited."}, status=429)
+            return web.json_response(
+                {
+                    "id": request.match_info["paste_id"],
+                    "has_password": False,
+                    "views": 1,
+                    "created_at": "2024-01-01T12:00:00.000000+00:00",
+                    "expires": None,
+                    "files": [],
+                }
+            )
+
+        app = web.Application()
+        app.router.add_get("/api/paste/{paste_id}", get)
+        app_runner = web.AppRunner(app)
+        await app_runner.setup()
+        await web.TCPSite(app_runner, "127.0.0.1", 0).start()
+        host, port = app_runner.addresses[0][:2]
+        try:
+            async with mystbin.Client(root_url=f"http://{host}:{port}") as client:
+                await asyncio.gather(*(client.get_paste(f"paste{index}") for index in range(5)))
+        finally:
+            await app_runner.cleanup()
+
+        assert statuses == {429: 1, 200: 5}
+
+    asyncio.run(runner())